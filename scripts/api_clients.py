@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+API Clients
+
+Network SDKs for the codex_* scripts, imported and constructed on first
+use. Importing openai and requests dominates the scripts' startup time,
+and constructing OpenAI() fails without an API key, so the offline paths
+(source analysis, deduplication, dry runs) never touch either.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=None)
+def openai_sdk():
+    """The openai module, configured with OPENAI_API_KEY."""
+    import openai
+    openai.api_key = os.getenv("OPENAI_API_KEY")
+    return openai
+
+
+@lru_cache(maxsize=None)
+def openai_client() -> Optional[Any]:
+    """A shared OpenAI() client with openai>=1.0, or None with an older SDK."""
+    openai = openai_sdk()
+    if not hasattr(openai, "OpenAI"):
+        return None
+    return openai.OpenAI()  # api_key is read from env var
+
+
+def chat_completion(**kwargs) -> str:
+    """Create a chat completion with whichever SDK generation is installed and return its text."""
+    client = openai_client()
+    if client is not None:
+        rsp = client.chat.completions.create(**kwargs)
+    else:
+        rsp = openai_sdk().ChatCompletion.create(**kwargs)
+    return rsp.choices[0].message.content
+
+
+def http():
+    """The requests module."""
+    import requests
+    return requests
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+Taxonomy Benchmark Suite
+
+Generates synthetic taxonomies at several scales and times attribute
+loading, consolidation and validation on each. Results are written as a
+JSON baseline that later runs can be compared against.
+
+Run this script from the root of the repository:
+  python scripts/benchmark.py --scales small medium --output baseline.json
+  python scripts/benchmark.py --scales small medium --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from generate_taxonomy import generate_taxonomy
+from taxonomy_loader import load_attribute_records
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Generator parameters for each named scale
+SCALES = {
+    "small": {"attributes": 100, "depth": 2, "fanout": 4, "products": 1_000},
+    "medium": {"attributes": 1_000, "depth": 3, "fanout": 6, "products": 10_000},
+    "large": {"attributes": 10_000, "depth": 4, "fanout": 8, "products": 100_000},
+}
+
+# A benchmark is slower than the baseline when it takes this many times as long
+DEFAULT_TOLERANCE = 1.25
+
+
+def run_script(script: str, *args: str) -> Callable[[], None]:
+    """Return a callable that runs one of the repository scripts as CI does."""
+    command = [sys.executable, str(SCRIPTS_DIR / script), *args]
+
+    def run():
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return run
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Time `fn` `repeat` times and return the min and median in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+
+def benchmarks(root: Path) -> Dict[str, Callable[[], Any]]:
+    """The timed operations for a generated taxonomy at `root`."""
+    return {
+        "load_attributes": lambda: load_attribute_records(root / "attributes"),
+        "consolidate": run_script("consolidate_attributes.py", "--root", str(root)),
+        "validate": run_script("validate.py", "--root", str(root)),
+        "validate_parallel": run_script("validate.py", "--root", str(root), "--jobs", "0"),
+        "validate_products": run_script("validate.py", "--root", str(root),
+                                        "--products", str(root / "products.jsonl")),
+    }
+
+
+def run_scale(name: str, work_dir: Path, repeat: int) -> Dict[str, Any]:
+    """Generate the taxonomy for one scale and time every benchmark on it."""
+    params = SCALES[name]
+    root = work_dir / name
+    print(f"[{name}] generating {params}...")
+    start = time.perf_counter()
+    counts = generate_taxonomy(root, **params)
+    timings = {"generate": {"min": time.perf_counter() - start}}
+    for bench, fn in benchmarks(root).items():
+        timings[bench] = time_call(fn, repeat)
+        print(f"[{name}] {bench}: {timings[bench]['min']:.3f}s")
+    return {"params": params, "counts": counts, "timings": timings}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print per-benchmark ratios against a baseline and return the regressions."""
+    regressions = []
+    print(f"\n{'scale':<8} {'benchmark':<20} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for scale, result in results["scales"].items():
+        base = baseline.get("scales", {}).get(scale)
+        if base is None or base["params"] != result["params"]:
+            continue
+        for bench, timing in result["timings"].items():
+            if bench == "generate" or bench not in base["timings"]:
+                continue
+            before, after = base["timings"][bench]["min"], timing["min"]
+            ratio = after / before if before else float("inf")
+            flag = " !" if ratio > tolerance else ""
+            print(f"{scale:<8} {bench:<20} {before:>9.3f}s {after:>9.3f}s {ratio:>6.2f}x{flag}")
+            if ratio > tolerance:
+                regressions.append(f"{scale}/{bench}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark taxonomy loading, consolidation and validation.")
+    parser.add_argument("--scales", nargs="+", choices=sorted(SCALES), default=["small", "medium"],
+                        help="scales to run (default: small medium)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (default: 3)")
+    parser.add_argument("--work-dir", type=Path,
+                        help="where to generate taxonomies (default: a temporary directory)")
+    parser.add_argument("--output", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="compare against a previous --output and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"slowdown ratio treated as a regression (default: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="taxonomy-bench-") as tmp:
+        work_dir = args.work_dir or Path(tmp)
+        for name in args.scales:
+            results["scales"][name] = run_scale(name, work_dir, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\nSlower than baseline by more than {args.tolerance}x: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
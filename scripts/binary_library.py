@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Binary Attribute Library
+
+A compact binary sidecar for attributes/consolidated/consolidated_attributes.json
+that can be memory-mapped and queried by code without parsing the whole
+library. consolidate_attributes.py writes it next to the JSON file.
+
+Layout (little-endian):
+  header   magic b"TXAT", u16 version, u16 reserved, u32 attribute count
+  table    one entry per attribute, sorted by UTF-8 code:
+             u32 code offset, u32 code length, u32 record offset, u32 record length
+  data     the codes, then each attribute as compact UTF-8 JSON
+
+All offsets are from the start of the file, so a lookup is a binary
+search over the fixed-size table plus one small json.loads.
+"""
+
+import json
+import mmap
+import struct
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+MAGIC = b"TXAT"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<IIII")
+
+# File name of the sidecar, next to the consolidated JSON file
+BINARY_NAME = "consolidated_attributes.bin"
+
+
+def binary_path(consolidated_file) -> Path:
+    """Path of the binary sidecar for a consolidated JSON file."""
+    return Path(consolidated_file).with_name(BINARY_NAME)
+
+
+def encode_library(attributes: Dict[str, Dict[str, Any]]) -> bytes:
+    """Encode a consolidated attribute map in the binary format.
+
+    Output depends only on the map's contents, not its order.
+    """
+    items = sorted((code.encode(), json.dumps(attr, separators=(",", ":"), ensure_ascii=False).encode())
+                   for code, attr in attributes.items())
+    offset = HEADER.size + ENTRY.size * len(items)
+    code_offsets = []
+    for code, _ in items:
+        code_offsets.append(offset)
+        offset += len(code)
+    table = []
+    for (code, record), code_offset in zip(items, code_offsets):
+        table.append(ENTRY.pack(code_offset, len(code), offset, len(record)))
+        offset += len(record)
+    return b"".join([HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(items)), *table,
+                     *(code for code, _ in items), *(record for _, record in items)])
+
+
+class BinaryLibrary(Mapping):
+    """Read-only, memory-mapped view of a binary attribute library.
+
+    Behaves like the "attributes" mapping of the consolidated JSON file;
+    records are decoded on access.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._count = HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._data.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} binary attribute library")
+
+    def _entry(self, index: int):
+        return ENTRY.unpack_from(self._data, HEADER.size + ENTRY.size * index)
+
+    def _code(self, index: int) -> bytes:
+        code_offset, code_length, _, _ = self._entry(index)
+        return self._data[code_offset:code_offset + code_length]
+
+    def _find(self, code: str) -> int:
+        key = code.encode()
+        index = bisect_left(range(self._count), key, key=self._code)
+        if index == self._count or self._code(index) != key:
+            raise KeyError(code)
+        return index
+
+    def __getitem__(self, code: str) -> Dict[str, Any]:
+        if not isinstance(code, str):
+            raise KeyError(code)
+        _, _, record_offset, record_length = self._entry(self._find(code))
+        return json.loads(self._data[record_offset:record_offset + record_length])
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._code(index).decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+"""
+Validator Builder
+
+Compiles the small, fixed product and attribute schemas into specialized
+Python functions (scripts/generated_validators.py). validate.py uses them
+as a fast path and falls back to jsonschema for anything they reject, so
+reported errors never change.
+
+For each schema two functions are generated:
+  is_valid_<name>(instance)     -> bool, stops at the first problem
+  iter_errors_<name>(instance)  -> yields (path, message) exactly as
+                                   jsonschema's iter_errors would
+
+Run this script from the root of the repository:
+  python scripts/build_validators.py            # regenerate
+  python scripts/build_validators.py --check    # fail if stale or if results differ from jsonschema
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_DIR = ROOT / "schema"
+OUTPUT_FILE = Path(__file__).resolve().parent / "generated_validators.py"
+
+# Schemas to compile, and the suffix used for their function names
+SCHEMAS = {
+    "attribute.schema.json": "attribute",
+    "product.schema.json": "product",
+}
+
+# jsonschema's draft 2020-12 type checks, as expressions over {v}
+TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+# Keywords that never produce errors
+IGNORED_KEYWORDS = {"$id", "$schema", "title", "description", "$comment"}
+
+
+def set_literal(values) -> str:
+    """A set display with a stable order; CPython folds `x in {...}` into a frozenset constant."""
+    return "{" + ", ".join(repr(value) for value in sorted(values)) + "}"
+
+
+class _Emitter:
+    """Emits the body of one validator function.
+
+    In "errors" mode failures yield (path, message); in "bool" mode they return False.
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.lines = []
+        self.counter = 0
+
+    def line(self, indent: int, code: str) -> None:
+        self.lines.append("    " * indent + code)
+
+    def name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def fail(self, indent: int, path: List[str], message: str) -> None:
+        if self.mode == "errors":
+            path_expr = "(" + ", ".join(path) + ("," if len(path) == 1 else "") + ")"
+            self.line(indent, f"yield {path_expr}, {message}")
+        else:
+            self.line(indent, "return False")
+
+    def schema(self, schema: Dict[str, Any], var: str, path: List[str], indent: int) -> None:
+        """Emit checks for `schema` against the value in `var`, keyword by keyword in schema order."""
+        if not isinstance(schema, dict):
+            raise ValueError(f"unsupported schema {schema!r}")
+        for keyword, value in schema.items():
+            if keyword in IGNORED_KEYWORDS:
+                continue
+            emit = getattr(self, "kw_" + keyword, None)
+            if emit is None:
+                raise ValueError(f"unsupported keyword {keyword!r}")
+            emit(value, schema, var, path, indent)
+
+    def kw_type(self, value, schema, var, path, indent):
+        types = [value] if isinstance(value, str) else list(value)
+        check = " or ".join(TYPE_CHECKS[t].format(v=var) for t in types)
+        reprs = ", ".join(repr(t) for t in types)
+        self.line(indent, f"if not ({check}):")
+        self.fail(indent + 1, path, f"repr({var}) + {' is not of type ' + reprs!r}")
+
+    def kw_enum(self, value, schema, var, path, indent):
+        if not all(isinstance(each, str) for each in value):
+            raise ValueError("only string enums are supported")
+        self.line(indent, f"if not (isinstance({var}, str) and {var} in {set_literal(value)}):")
+        self.fail(indent + 1, path, f"repr({var}) + {' is not one of ' + repr(value)!r}")
+
+    def kw_required(self, value, schema, var, path, indent):
+        self.line(indent, f"if isinstance({var}, dict):")
+        for prop in value:
+            self.line(indent + 1, f"if {prop!r} not in {var}:")
+            self.fail(indent + 2, path, repr(f"{prop!r} is a required property"))
+
+    def kw_properties(self, value, schema, var, path, indent):
+        checked = {prop: subschema for prop, subschema in value.items() if subschema not in ({}, True)}
+        if not checked:
+            return
+        self.line(indent, f"if isinstance({var}, dict):")
+        for prop, subschema in checked.items():
+            child = self.name("v")
+            self.line(indent + 1, f"if {prop!r} in {var}:")
+            self.line(indent + 2, f"{child} = {var}[{prop!r}]")
+            self.schema(subschema, child, path + [repr(prop)], indent + 2)
+
+    def kw_additionalProperties(self, value, schema, var, path, indent):
+        if value is not False or "patternProperties" in schema:
+            raise ValueError("only additionalProperties: false is supported")
+        allowed = set_literal(schema.get("properties", {}))
+        extras = self.name("extras")
+        self.line(indent, f"if isinstance({var}, dict):")
+        self.line(indent + 1, f"{extras} = [key for key in {var} if key not in {allowed}]")
+        self.line(indent + 1, f"if {extras}:")
+        if self.mode == "errors":
+            self.line(indent + 2, f"{extras}.sort(key=str)")
+            message = (f"'Additional properties are not allowed (' + ', '.join(map(repr, {extras})) + "
+                       f"(' was unexpected)' if len({extras}) == 1 else ' were unexpected)')")
+        else:
+            message = None
+        self.fail(indent + 2, path, message)
+
+    def kw_items(self, value, schema, var, path, indent):
+        if not isinstance(value, dict) or "prefixItems" in schema:
+            raise ValueError("only a single items schema is supported")
+        if value in ({}, True):
+            return
+        index, child = self.name("i"), self.name("v")
+        self.line(indent, f"if isinstance({var}, list):")
+        self.line(indent + 1, f"for {index}, {child} in enumerate({var}):")
+        self.schema(value, child, path + [index], indent + 2)
+
+    def kw_minimum(self, value, schema, var, path, indent):
+        self.line(indent, f"if {TYPE_CHECKS['number'].format(v=var)} and {var} < {value!r}:")
+        self.fail(indent + 1, path, f"repr({var}) + {' is less than the minimum of ' + repr(value)!r}")
+
+    def kw_maximum(self, value, schema, var, path, indent):
+        self.line(indent, f"if {TYPE_CHECKS['number'].format(v=var)} and {var} > {value!r}:")
+        self.fail(indent + 1, path, f"repr({var}) + {' is greater than the maximum of ' + repr(value)!r}")
+
+
+def schema_digest(schema_file: str) -> str:
+    return hashlib.sha256((SCHEMA_DIR / schema_file).read_bytes()).hexdigest()
+
+
+def load_schema(schema_file: str) -> Dict[str, Any]:
+    with open(SCHEMA_DIR / schema_file) as f:
+        return json.load(f)
+
+
+def generate_function(schema: Dict[str, Any], name: str, mode: str) -> List[str]:
+    """Generate one validator function for `schema`."""
+    emitter = _Emitter(mode)
+    emitter.schema(schema, "instance", [], 1)
+    if mode == "bool":
+        header = f"def is_valid_{name}(instance):"
+        footer = ["    return True"]
+    else:
+        header = f"def iter_errors_{name}(instance):"
+        footer = ["    return", "    yield"] if not emitter.lines else []
+    return [header] + emitter.lines + footer
+
+
+def generate_module() -> str:
+    """Generate the source of generated_validators.py."""
+    lines = [
+        "# Generated by scripts/build_validators.py from schema/*.schema.json -- do not edit.",
+        "# Regenerate with: python scripts/build_validators.py",
+        "",
+        "from numbers import Number as _Number",
+        "",
+        "# SHA-256 of each schema file these validators were generated from",
+        "SCHEMA_HASHES = {",
+    ]
+    lines += [f"    {schema_file!r}: {schema_digest(schema_file)!r}," for schema_file in SCHEMAS]
+    lines.append("}")
+    for schema_file, name in SCHEMAS.items():
+        schema = load_schema(schema_file)
+        for mode in ("bool", "errors"):
+            lines += ["", ""] + generate_function(schema, name, mode)
+    lines += ["", "", "# schema file -> (is_valid, iter_errors)", "VALIDATORS = {"]
+    lines += [f"    {schema_file!r}: (is_valid_{name}, iter_errors_{name})," for schema_file, name in SCHEMAS.items()]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+# --- differential check against jsonschema ---------------------------------
+
+# Replacement values used to break documents in every position
+WRONG_VALUES = [None, True, 0, -1, 1.5, 101, "", "x", [], {}, [1], {"x": 1}]
+
+
+def mutations(instance: Any) -> Iterator[Any]:
+    """Yield the instance and broken variants of it: each value replaced,
+    each key removed and an unknown key added, at every depth."""
+    yield instance
+    if isinstance(instance, dict):
+        for key in instance:
+            removed = dict(instance)
+            del removed[key]
+            yield removed
+        yield {**instance, "zz_unexpected": 1, "aa_unexpected": 2}
+        yield {**instance, 1: "non-string key"}
+        items = list(instance.items())
+    elif isinstance(instance, list):
+        items = list(enumerate(instance))
+    else:
+        return
+    for key, value in items:
+        for replacement in WRONG_VALUES + list(mutations(value))[1:]:
+            mutated = copy.copy(instance)
+            mutated[key] = replacement
+            yield mutated
+
+
+def repository_instances(schema_file: str) -> List[Any]:
+    """Documents in this repository that `schema_file` applies to."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from taxonomy_loader import load_attribute_records, to_consolidated
+
+    if schema_file == "product.schema.json":
+        paths = sorted((ROOT / "examples").glob("*.json"))
+        return [json.loads(path.read_text()) for path in paths]
+    instances = [to_consolidated(record.data) for record in load_attribute_records(ROOT / "attributes")]
+    consolidated = ROOT / "attributes" / "consolidated" / "consolidated_attributes.json"
+    instances += list(json.loads(consolidated.read_text())["attributes"].values())
+    for path in sorted((ROOT / "attributes" / "backup").glob("*.json")):
+        data = json.loads(path.read_text())
+        instances += list(data["attributes"].values()) if "attributes" in data else [data]
+    return instances
+
+
+def differential_check(namespace: Dict[str, Any]) -> int:
+    """Compare the generated validators with jsonschema on repository data and its mutations."""
+    import jsonschema
+
+    failures = 0
+    for schema_file in SCHEMAS:
+        schema = load_schema(schema_file)
+        reference = jsonschema.validators.validator_for(schema)(schema)
+        is_valid, iter_errors = namespace["VALIDATORS"][schema_file]
+        checked = 0
+        for base in repository_instances(schema_file):
+            for instance in mutations(base):
+                expected = [(tuple(e.absolute_path), e.message) for e in reference.iter_errors(instance)]
+                actual = list(iter_errors(instance))
+                checked += 1
+                if actual != expected or is_valid(instance) != (not expected):
+                    failures += 1
+                    print(f"Mismatch for {schema_file} on {instance!r}:\n"
+                          f"  jsonschema: {expected}\n  generated:  {actual}")
+        print(f"{schema_file}: compared {checked} documents against jsonschema")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate schema-specialized validators.")
+    parser.add_argument("--check", action="store_true",
+                        help="verify the generated module is up to date and agrees with jsonschema")
+    args = parser.parse_args(argv)
+
+    source = generate_module()
+    if not args.check:
+        OUTPUT_FILE.write_text(source)
+        print(f"Wrote {OUTPUT_FILE}")
+        return 0
+
+    if not OUTPUT_FILE.exists() or OUTPUT_FILE.read_text() != source:
+        print(f"{OUTPUT_FILE.name} is out of date; run python scripts/build_validators.py")
+        return 1
+    namespace = {}
+    exec(compile(source, str(OUTPUT_FILE), "exec"), namespace)
+    failures = differential_check(namespace)
+    if failures:
+        print(f"{failures} document(s) validated differently from jsonschema")
+        return 1
+    print("Generated validators agree with jsonschema")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""
+Category Index
+
+Flattens the category trees in categories/*.json into
+  - a path index: "Root > Child > Leaf" -> node entry
+  - a name index: category name -> every path with that name
+and gives every node its materialized attribute requirements, computed
+once in a memoized depth-first pass:
+  - a leaf requires the attributes it lists, at their commonality_threshold
+  - an internal node requires the attributes that all of its children
+    require, at the lowest threshold among them
+
+Category lookups and requirement checks are then dictionary lookups
+instead of tree walks.
+
+Run this script from the root of the repository:
+  python scripts/category_index.py --output category_index.json
+  python scripts/category_index.py --lookup "Boom Lifts"
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Separator between names in a category path, as in validation messages
+PATH_SEPARATOR = " > "
+
+INDEX_VERSION = 1
+
+CategoryPath = Union[str, Sequence[str]]
+
+
+def path_key(path: CategoryPath) -> str:
+    """Normalize "A > B" or ("A", "B") to the "A > B" form used as index key."""
+    if isinstance(path, str):
+        return PATH_SEPARATOR.join(name.strip() for name in path.split(PATH_SEPARATOR.strip()))
+    return PATH_SEPARATOR.join(path)
+
+
+class CategoryIndex:
+    """Path and name indexes over category trees, with materialized requirements.
+
+    Each node entry is a dict with "name", "path" (list of names), "depth",
+    "leaf", "children" (child path keys) and "attributes" ({code: threshold},
+    the materialized requirements).
+    """
+
+    def __init__(self, nodes: Dict[str, Dict[str, Any]]):
+        self.nodes = nodes
+        self.paths_by_name = {}
+        for key, node in nodes.items():
+            self.paths_by_name.setdefault(node["name"], []).append(key)
+
+    def node(self, path: CategoryPath) -> Optional[Dict[str, Any]]:
+        """The node entry at `path`, or None."""
+        return self.nodes.get(path_key(path))
+
+    def paths_for_name(self, name: str) -> List[str]:
+        """Paths of every category called `name`."""
+        return self.paths_by_name.get(name, [])
+
+    def resolve(self, category: str) -> List[str]:
+        """Paths matching a product's "category": an exact path, otherwise every node with that name."""
+        key = path_key(category)
+        if key in self.nodes:
+            return [key]
+        return self.paths_for_name(category)
+
+    def requirements(self, path: CategoryPath) -> Dict[str, int]:
+        """Materialized {code: commonality_threshold} for the category at `path`."""
+        node = self.node(path)
+        if node is None:
+            raise KeyError(path)
+        return node["attributes"]
+
+    def missing_attributes(self, path: CategoryPath, codes: Iterable[str], min_threshold: int = 100) -> List[str]:
+        """Required codes (at `min_threshold` or above) of the category at `path` not in `codes`."""
+        present = set(codes)
+        return sorted(code for code, threshold in self.requirements(path).items()
+                      if threshold >= min_threshold and code not in present)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"version": INDEX_VERSION, "nodes": self.nodes, "names": self.paths_by_name}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CategoryIndex":
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"unsupported category index version {data.get('version')!r}")
+        return cls(data["nodes"])
+
+
+def build_category_index(trees: Iterable[Dict[str, Any]]) -> CategoryIndex:
+    """Flatten category trees into a CategoryIndex in one memoized depth-first pass."""
+    nodes = {}
+
+    def visit(node: Dict[str, Any], names: List[str]) -> Dict[str, int]:
+        key = PATH_SEPARATOR.join(names)
+        if key in nodes:
+            raise ValueError(f"duplicate category path '{key}'")
+        entry = nodes[key] = {"name": node["name"], "path": names, "depth": len(names) - 1,
+                              "leaf": "subcategories" not in node, "children": [], "attributes": {}}
+        if entry["leaf"]:
+            entry["attributes"] = {ref["ref"]: ref["commonality_threshold"] for ref in node.get("attributes", [])}
+            return entry["attributes"]
+        shared = None
+        for child in node["subcategories"]:
+            child_names = names + [child["name"]]
+            entry["children"].append(PATH_SEPARATOR.join(child_names))
+            required = visit(child, child_names)
+            if shared is None:
+                shared = dict(required)
+            else:
+                shared = {code: min(threshold, required[code])
+                          for code, threshold in shared.items() if code in required}
+        entry["attributes"] = shared or {}
+        return entry["attributes"]
+
+    for tree in trees:
+        visit(tree, [tree["name"]])
+    return CategoryIndex(nodes)
+
+
+def load_category_trees(categories_dir: Path) -> List[Dict[str, Any]]:
+    trees = []
+    for file_path in sorted(Path(categories_dir).glob("*.json")):
+        with open(file_path, 'r') as f:
+            trees.append(json.load(f))
+    return trees
+
+
+def load_category_index(root: Path = ROOT, index_file: Optional[Path] = None) -> CategoryIndex:
+    """Load a prebuilt index from `index_file`, or build one from root/categories."""
+    if index_file is not None:
+        with open(index_file, 'r') as f:
+            return CategoryIndex.from_json(json.load(f))
+    return build_category_index(load_category_trees(Path(root) / "categories"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the category path/name index.")
+    parser.add_argument("--root", type=Path, default=ROOT,
+                        help="taxonomy root to index (default: this repository)")
+    parser.add_argument("--output", type=Path, help="write the index as JSON")
+    parser.add_argument("--lookup", metavar="CATEGORY",
+                        help="print the paths and requirements for a category path or name")
+    args = parser.parse_args(argv)
+
+    index = load_category_index(args.root)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(index.to_json(), f, indent=2)
+        print(f"Indexed {len(index.nodes)} categories to {args.output}")
+    if args.lookup:
+        paths = index.resolve(args.lookup)
+        if not paths:
+            print(f"No category matches '{args.lookup}'")
+            return 1
+        for path in paths:
+            print(path)
+            for code, threshold in sorted(index.requirements(path).items()):
+                print(f"  {code} ({threshold}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
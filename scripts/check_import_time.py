@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Import-Time Budget Check
+
+Imports each offline entry point in a fresh interpreter, without an API
+key, and fails if it pulls in a network SDK or takes longer than the
+budget. Keeps analysis, deduplication and dry runs fast and usable offline.
+
+Run this script from the root of the repository:
+  python scripts/check_import_time.py
+  python scripts/check_import_time.py --budget 0.5 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Modules whose import must not pay for the network SDKs
+ENTRY_POINTS = [
+    "codex_enhanced",
+    "codex_enhanced_brand_aware",
+    "codex_enhanced_with_catalogs",
+    "codex_populate",
+]
+
+# Modules that may only be imported when a network call is made
+NETWORK_MODULES = ("openai", "requests", "httpx")
+
+# Seconds allowed for importing one entry point (best of --repeat runs)
+DEFAULT_BUDGET = 0.3
+
+PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds,
+                  "loaded": sorted(m for m in sys.argv[2:] if m in sys.modules)}))
+"""
+
+
+def probe(module: str) -> dict:
+    """Import `module` in a fresh interpreter and report the time taken and network modules loaded."""
+    env = {key: value for key, value in os.environ.items() if key != "OPENAI_API_KEY"}
+    result = subprocess.run([sys.executable, "-c", PROBE, module, *NETWORK_MODULES],
+                            cwd=SCRIPTS_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check import time of the offline entry points.")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help=f"seconds allowed per entry point (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--repeat", type=int, default=3, help="imports per entry point; the best counts (default: 3)")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module in ENTRY_POINTS:
+        runs = [probe(module) for _ in range(args.repeat)]
+        errors = [run["error"] for run in runs if "error" in run]
+        if errors:
+            print(f"{module}: ✗ import failed: {errors[0]}")
+            failures += 1
+            continue
+        best = min(run["seconds"] for run in runs)
+        loaded = sorted({name for run in runs for name in run["loaded"]})
+        ok = best <= args.budget and not loaded
+        detail = f"imports {', '.join(loaded)}" if loaded else f"{best * 1000:.0f} ms"
+        print(f"{module}: {'✓' if ok else '✗'} {detail}")
+        failures += not ok
+
+    if failures:
+        print(f"\n{failures} entry point(s) over the {args.budget}s budget or importing network SDKs")
+        return 1
+    print(f"\nAll entry points import within {args.budget}s without network SDKs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
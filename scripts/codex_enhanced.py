@@ -7,9 +7,12 @@ Enhanced Codex attribute proposer:
  • Updates the attribute library with high-quality suggestions
  • Creates a PR for human review
 """
-import json, os, subprocess, datetime, pathlib, requests, openai, sys, re
+import json, os, subprocess, datetime, pathlib, sys, re
 from typing import Dict, List, Set, Any, Optional, Tuple
 
+# openai and requests are only imported when a network call is made
+from api_clients import http, openai_sdk
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 ATTR_FILE = ROOT / "attributes" / "consolidated_attributes.json"
 EXAMPLES_DIR = ROOT / "examples"
@@ -18,8 +21,6 @@ CATALOGS_DIR = ROOT / "data" / "product_catalogs"
 ATTR_SCHEMA_FILE = SCHEMA_DIR / "attribute.schema.json"
 BRANCH = f"codex/attr-{datetime.date.today()}"
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
-
 # Utility functions
 def git(*args):
     subprocess.check_call(["git", *args], cwd=ROOT, stdout=subprocess.DEVNULL)
@@ -157,7 +158,7 @@ def ask_codex(current_attrs: Dict[str, Any], example_attrs: Dict[str, Any], sche
     )
     
     # Call OpenAI API
-    rsp = openai.ChatCompletion.create(
+    rsp = openai_sdk().ChatCompletion.create(
         model="gpt-4o-preview",
         messages=[
             {"role":"system","content":"You are an expert taxonomy curator for construction equipment."},
@@ -287,8 +288,8 @@ def main():
     }
     
     api = f"https://api.github.com/repos/{repo}"
-    prs = requests.get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
-                       headers=headers, timeout=20).json()
+    prs = http().get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
+                     headers=headers, timeout=20).json()
     
     if prs:
         print("PR already exists; branch just force-pushed.")
@@ -317,7 +318,7 @@ def main():
     )
     
     # Create PR
-    requests.post(
+    http().post(
         f"{api}/pulls",
         headers=headers,
         json={
@@ -6,9 +6,10 @@ Brand-Aware Codex attribute proposer:
  u2022 Applies strict schema validation and deduplication
  u2022 Creates a PR for human review
 """
-import json, os, subprocess, datetime, pathlib, requests, openai, sys, re
-from typing import Dict, List, Set, Any, Optional, Tuple
+import json, os, subprocess, datetime, pathlib, sys, re
+from typing import Dict, Iterable, List, Set, Any, Optional, Tuple
 from collections import defaultdict
+from functools import lru_cache
 
 # Import physics attribute normalizer
 try:
@@ -31,13 +32,15 @@ except ImportError:
         def is_scientific_attribute(attr_name):
             return True  # Assume all are scientific in fallback mode
 
-# Support both openai <1 and >=1
-try:
-    from openai import OpenAI  # type: ignore
-    _OPENAI_CLIENT = OpenAI()
-    _USE_CLIENT = True
-except ImportError:  # old sdk
-    _USE_CLIENT = False
+# openai and requests are only imported when a network call is made
+from api_clients import chat_completion, http
+from manufacturer_matcher import ManufacturerMatcher
+from spec_scanner import SPEC_PATTERN, scan_specs, spec_unit
+from quantity import QUANTITY_PATTERN, UNITS
+from page_source import Page, iter_pages
+from page_reduce import map_reduce_pages
+from page_cache import CachedExtractor, extractor_version
+from binary_library import binary_path
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 
@@ -56,8 +59,6 @@ SOURCE_CONTENT_DIR = CATALOGS_DIR / "example_source_content" / "pages copy"
 ATTR_SCHEMA_FILE = SCHEMA_DIR / "attribute.schema.json"
 BRANCH = f"codex/attr-{datetime.date.today()}"
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
-
 # Common manufacturer names to help identify brand-specific content
 MANUFACTURER_KEYWORDS = [
     "Caterpillar", "CAT", "John Deere", "JLG", "Genie", "Bobcat", "Komatsu", 
@@ -65,6 +66,9 @@ MANUFACTURER_KEYWORDS = [
     "Kobelco", "Doosan", "Takeuchi", "JCB", "New Holland", "Manitou", "Skyjack"
 ]
 
+# All manufacturers are found in one pass over a page
+MANUFACTURER_MATCHER = ManufacturerMatcher(MANUFACTURER_KEYWORDS)
+
 # Define subcategories for physics attributes
 PHYSICS_SUBCATEGORIES = {
     # Dimensions and size-related attributes
@@ -138,132 +142,161 @@ def determine_subcategory(attr_code, attr_data, category):
     return "general"
 
 def detect_manufacturer(content: str) -> Optional[str]:
-    """Detect which manufacturer is mentioned in the content."""
-    for manufacturer in MANUFACTURER_KEYWORDS:
-        if re.search(r'\b' + re.escape(manufacturer) + r'\b', content, re.IGNORECASE):
-            return manufacturer
-    return None
-
-def analyze_source_content() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Set[str]]]:
-    """Analyze source content pages to extract potential attributes and track manufacturer presence."""
-    potential_attributes = {}
-    normalized_physics_attributes = {}  # Track normalized physics attributes
-    manufacturer_attributes = defaultdict(set)  # Track which manufacturers have which attributes
-    manufacturer_count = defaultdict(set)      # Count unique manufacturers for each attribute
+    """Detect which manufacturer is mentioned in the content (the earliest listed, if several are)."""
+    return MANUFACTURER_MATCHER.first_listed(content)
+
+def detect_manufacturers(content: str) -> Dict[str, int]:
+    """Detect every manufacturer mentioned in the content, with its number of mentions."""
+    return MANUFACTURER_MATCHER.counts(content)
+
+# Attribute names too generic to be specs
+SKIPPED_ATTRIBUTE_NAMES = frozenset(['the', 'and', 'for', 'with'])
+
+# Words in an attribute name that make it brand-specific
+BRAND_NAME_PATTERN = re.compile('model|series|brand|type|certification|standard|warranty')
+
+# Direct subcategory overrides for important physics concepts, checked in order.
+# This ensures proper scientific classification even if the normalizer isn't updated.
+PHYSICS_SUBCATEGORY_OVERRIDES = [
+    (re.compile('weight|mass'), "mass"),  # Weight is a mass property, not dimensional
+    (re.compile('length|height|width|diameter'), "dimensions"),
+    (re.compile('power|energy|output'), "power"),
+    (re.compile('force|pressure|torque'), "force"),
+]
+
+@lru_cache(maxsize=None)
+def classify_attribute_name(attr_name: str) -> Tuple[str, str, str]:
+    """Return (attr_key, category, subcategory) for an extracted attribute name.
+    
+    Names repeat across pages, so each distinct name is classified once.
+    """
+    lower_name = attr_name.lower()
+    attr_key = re.sub(r'\W+', '_', lower_name)
+    
+    # Physics unless the normalizer disagrees or the name looks brand-specific
+    if not is_scientific_attribute(attr_name) or BRAND_NAME_PATTERN.search(lower_name):
+        return attr_key, "brand", "general"
+    
+    _, subcategory = normalize_physics_attribute(attr_name)
+    for pattern, override in PHYSICS_SUBCATEGORY_OVERRIDES:
+        if pattern.search(lower_name):
+            subcategory = override
+            break
+    return attr_key, "physics", subcategory
+
+class AttributeTally:
+    """Attributes found on a run of pages: first-seen records, counts, sources and manufacturers.
+
+    Tallies merge with +=, which is associative, so pages can be tallied
+    separately (in worker processes) and merged in page order with the same
+    result as tallying them one after another.
+    """
+
+    def __init__(self):
+        self.attributes = {}                   # attr_key -> record, as returned by analyze_source_content
+        self.manufacturers = defaultdict(set)  # attr_key -> manufacturers seen alongside it
+        self._sources = {}                     # attr_key -> set of its record's sources
+
+    def add(self, attr_key: str, name: str, category: str, subcategory: str, unit: Optional[str],
+            source: str, manufacturers: Iterable[str]):
+        record = self.attributes.get(attr_key)
+        if record is None:
+            record = self.attributes[attr_key] = {
+                "name": name.strip(),
+                "category": category,
+                "sources": [source],
+                "count": 1,
+                "subcategory": subcategory,
+            }
+            if unit:
+                record["unit"] = unit.strip()
+            self._sources[attr_key] = {source}
+        else:
+            record["count"] += 1
+            if source not in self._sources[attr_key]:
+                self._sources[attr_key].add(source)
+                record["sources"].append(source)
+        if manufacturers:
+            self.manufacturers[attr_key].update(manufacturers)
+
+    def __iadd__(self, other: "AttributeTally") -> "AttributeTally":
+        for attr_key, theirs in other.attributes.items():
+            record = self.attributes.get(attr_key)
+            if record is None:
+                # The first record seen keeps its name, category, subcategory and unit
+                self.attributes[attr_key] = dict(theirs, sources=list(theirs["sources"]))
+                self._sources[attr_key] = set(other._sources[attr_key])
+                continue
+            record["count"] += theirs["count"]
+            seen = self._sources[attr_key]
+            for source in theirs["sources"]:
+                if source not in seen:
+                    seen.add(source)
+                    record["sources"].append(source)
+        for attr_key, manufacturers in other.manufacturers.items():
+            self.manufacturers[attr_key].update(manufacturers)
+        return self
+
+# Version of scan_page's rules for the page cache: bump the revision when its code changes
+SCAN_VERSION = extractor_version(2, SPEC_PATTERN, QUANTITY_PATTERN, UNITS, MANUFACTURER_KEYWORDS,
+                                 MANUFACTURER_MATCHER.pattern, SKIPPED_ATTRIBUTE_NAMES)
+
+def scan_page(content: str) -> Dict[str, Any]:
+    """Find the manufacturers and the (name, unit) specs on a page; cached by page content."""
+    # Detect every manufacturer mentioned in this content
+    manufacturers = list(detect_manufacturers(content))
+    
+    # Extract potential attributes in one pass over the page
+    specs = []
+    for spec in scan_specs(content):
+        # Skip very short or non-specific attributes
+        if len(spec.name) < 3 or spec.name.lower() in SKIPPED_ATTRIBUTE_NAMES:
+            continue
+        
+        # Detect unit: in parentheses after the value, else that of its first quantity
+        # (e.g., '67,500 lb (30,600 kg)' → 'lb')
+        unit = spec_unit(spec)
+        specs.append([spec.name, unit])
     
+    return {"manufacturers": manufacturers, "specs": specs}
+
+def tally_page(page: Page, scanned: Optional[Dict[str, Any]] = None) -> AttributeTally:
+    """Tally the potential attributes on one source content page, from its scan_page result if given."""
+    tally = AttributeTally()
+    try:
+        if scanned is None:
+            scanned = scan_page(page.text)
+        manufacturers = scanned["manufacturers"]
+        for attr_name, unit in scanned["specs"]:
+            attr_key, category, subcategory = classify_attribute_name(attr_name)
+            tally.add(attr_key, attr_name, category, subcategory, unit, page.source, manufacturers)
+    
+    except Exception as e:
+        print(f"Error processing source file {page.source}: {e}")
+    return tally
+
+def analyze_source_content(jobs: Optional[int] = None) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Set[str]]]:
+    """Analyze source content pages to extract potential attributes and track manufacturer presence.
+
+    Pages are tallied in `jobs` worker processes (default: PAGE_JOBS or one
+    per CPU) and merged in page order. Page scans are reused from the page
+    cache when the page text is unchanged.
+    """
     # Check if the source content directory exists
     if not SOURCE_CONTENT_DIR.exists():
         print(f"Source content directory not found: {SOURCE_CONTENT_DIR}")
         return {}, defaultdict(set)
     
-    # Process each page file
-    for file_path in SOURCE_CONTENT_DIR.glob("*.txt"):
-        try:
-            with file_path.open() as f:
-                content = f.read()
-                
-            # Detect manufacturer for this content
-            manufacturer = detect_manufacturer(content)
-            
-            # Extract potential attributes using patterns
-            # Look for patterns like "Specification: Value" or "Parameter: Value"
-            attribute_patterns = [
-                # "Name: Value" pattern
-                r'\b([A-Z][\w\s-]+(?:\([^)]+\))?)\s*:\s*([\w\d\.\s-]+)(?:\(([^)]+)\))?',
-                # Bullet point pattern with * or • symbol
-                r'[*•]\s*([A-Z][\w\s-]+(?:\([^)]+\))?)\s*:\s*([\w\d\.\s-]+)(?:\(([^)]+)\))?',
-                # Table-like format
-                r'\|\s*([A-Z][\w\s-]+(?:\([^)]+\))?)\s*\|\s*([\w\d\.\s-]+)(?:\(([^)]+)\))?\s*\|'
-            ]
-            
-            for pattern in attribute_patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    if len(match) >= 2:
-                        attr_name = match[0].strip()
-                        attr_value = match[1].strip()
-                        
-                        # Skip very short or non-specific attributes
-                        if len(attr_name) < 3 or attr_name.lower() in ['the', 'and', 'for', 'with']:
-                            continue
-                            
-                        # Generate a key for this attribute
-                        attr_key = re.sub(r'\W+', '_', attr_name.lower())
-                        
-                        # Detect unit if present (often in parentheses or after a value)
-                        unit = None
-                        
-                        # First check if unit is in parentheses in the match
-                        if len(match) > 2 and match[2]:
-                            unit = match[2].strip()
-                        else:
-                            # Try to extract primary unit from the value (e.g., '67,500 lb (30,600 kg)' → 'lb')
-                            unit_match = re.search(r'(\d+(?:[,\.]\d+)?)\s*([a-zA-Z]+(?:\s[a-zA-Z]+)?)', attr_value)
-                            unit = None
-                            if len(match) > 2 and match[2]:
-                                unit = match[2].strip()
-                            elif unit_match:
-                                unit = unit_match.group(2).strip()
-                        
-                        # Determine if this is a physics attribute
-                        is_physics = is_scientific_attribute(attr_name)
-                        
-                        # Check for brand patterns
-                        brand_patterns = ['model', 'series', 'brand', 'type', 'certification', 'standard', 'warranty']
-                        for pattern in brand_patterns:
-                            if pattern in attr_name.lower():
-                                is_physics = False
-                                break
-                        
-                        # Set category based on classification
-                        category = "physics" if is_physics else "brand"
-                        
-                        # Apply physics normalization if needed
-                        canonical_name = attr_key
-                        if is_physics:
-                            canonical_name, subcategory = normalize_physics_attribute(attr_name)
-                            
-                            # Direct mapping override for important physics concepts
-                            # This ensures proper scientific classification even if the normalizer isn't updated
-                            if "weight" in attr_name.lower() or "mass" in attr_name.lower():
-                                subcategory = "mass"  # Weight is a mass property, not dimensional
-                            elif any(dim in attr_name.lower() for dim in ["length", "height", "width", "diameter"]):
-                                subcategory = "dimensions"
-                            elif any(power in attr_name.lower() for power in ["power", "energy", "output"]):
-                                subcategory = "power"
-                            elif any(force in attr_name.lower() for force in ["force", "pressure", "torque"]):
-                                subcategory = "force"
-                        else:
-                            subcategory = "general"
-                            
-                        # Create or update the attribute record
-                        if attr_key not in potential_attributes:
-                            potential_attributes[attr_key] = {
-                                "name": attr_name.strip(),
-                                "category": category,
-                                "sources": [str(file_path)],
-                                "count": 1
-                            }
-                            
-                            # Set the subcategory for both physics and brand attributes
-                            potential_attributes[attr_key]["subcategory"] = subcategory
-                            
-                            # Add unit if available
-                            if unit:
-                                potential_attributes[attr_key]["unit"] = unit.strip()
-                        else:
-                            # Update existing attribute
-                            potential_attributes[attr_key]["count"] += 1
-                            if str(file_path) not in potential_attributes[attr_key]["sources"]:
-                                potential_attributes[attr_key]["sources"].append(str(file_path))
-                        
-                        # Track manufacturer association
-                        if manufacturer:
-                            manufacturer_attributes[attr_key].add(manufacturer)
-                            manufacturer_count[attr_key].add(manufacturer)
-        
-        except Exception as e:
-            print(f"Error processing source file {file_path}: {e}")
+    def report_unreadable(source, error):
+        print(f"Error processing source file {source}: {error}")
+    
+    # Pages are streamed one at a time from the page files or a catalog dump
+    pages = iter_pages(SOURCE_CONTENT_DIR, on_error=report_unreadable)
+    # Only pages not scanned before (by the same SCAN_VERSION) are scanned again
+    extract = CachedExtractor("brand_aware_source", SCAN_VERSION, scan_page, tally_page)
+    tally = map_reduce_pages(extract, pages, AttributeTally, jobs)
+    potential_attributes = tally.attributes
+    manufacturer_attributes = tally.manufacturers
     
     # Post-process to confirm attribute categories based on manufacturer presence
     for attr_key, manufacturers in manufacturer_attributes.items():
@@ -438,28 +471,15 @@ def ask_codex(current_attrs: Dict[str, Any], catalog_attrs: Dict[str, Dict[str,
     
     # Call OpenAI API
     model_name = os.getenv("OPENAI_MODEL", "gpt-4o")
-    if _USE_CLIENT:
-        rsp = _OPENAI_CLIENT.chat.completions.create(
-            model=model_name,
-            messages=[
-                {"role": "system", "content": "You are an expert taxonomy curator for construction equipment. You understand the distinction between brand-specific and physics-based attributes."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=1000
-        )
-        content = rsp.choices[0].message.content
-    else:
-        rsp = openai.ChatCompletion.create(
-            model=model_name,
-            messages=[
-                {"role": "system", "content": "You are an expert taxonomy curator for construction equipment. You understand the distinction between brand-specific and physics-based attributes."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=1000
-        )
-        content = rsp.choices[0].message.content
+    content = chat_completion(
+        model=model_name,
+        messages=[
+            {"role": "system", "content": "You are an expert taxonomy curator for construction equipment. You understand the distinction between brand-specific and physics-based attributes."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.2,
+        max_tokens=1000
+    )
     
     # Parse and validate response
     try:
@@ -597,7 +617,7 @@ def main():
     try:
         consolidate_script = ROOT / "scripts" / "consolidate_attributes.py"
         if consolidate_script.exists():
-            subprocess.check_call(["python", str(consolidate_script)], cwd=ROOT)
+            subprocess.check_call(["python", str(consolidate_script), "--incremental"], cwd=ROOT)
             print("Consolidated attribute file updated.")
     except subprocess.CalledProcessError as e:
         print(f"Warning: Failed to run consolidation script: {e}")
@@ -618,7 +638,8 @@ def main():
     git("config", "user.name", "codex-bot")
 
     # Commit and push changes
-    git("add", str(ATTR_FILE))
+    # The new attribute files and both copies of the library they were consolidated into
+    git("add", str(ATTR_FILE), str(binary_path(ATTR_FILE)), *map(str, created_files))
     git("commit", "-m", f"feat(codex): add attributes {', '.join(valid_attrs.keys())}")
     
     # Handle GitHub token for authentication
@@ -664,8 +685,8 @@ def main():
     }
     
     api = f"https://api.github.com/repos/{repo}"
-    prs = requests.get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
-                       headers=headers, timeout=20).json()
+    prs = http().get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
+                     headers=headers, timeout=20).json()
     
     if prs:
         print("PR already exists; branch just force-pushed.")
@@ -742,7 +763,7 @@ def main():
     
     # Create PR
     # Count was already calculated in PR body generation
-    requests.post(
+    http().post(
         f"{api}/pulls",
         headers=headers,
         json={
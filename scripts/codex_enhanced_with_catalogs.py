@@ -7,9 +7,13 @@ Enhanced Codex attribute proposer:
  u2022 Updates the attribute library with high-quality suggestions
  u2022 Creates a PR for human review
 """
-import json, os, subprocess, datetime, pathlib, requests, openai, sys, re
+import json, os, subprocess, datetime, pathlib, sys, re
 from typing import Dict, List, Set, Any, Optional, Tuple
 
+# openai and requests are only imported when a network call is made
+from api_clients import http, openai_sdk
+from quantity import parse_quantities
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 ATTR_FILE = ROOT / "attributes" / "consolidated_attributes.json"
 EXAMPLES_DIR = ROOT / "examples"
@@ -18,8 +22,6 @@ CATALOGS_DIR = ROOT / "data" / "product_catalogs"
 ATTR_SCHEMA_FILE = SCHEMA_DIR / "attribute.schema.json"
 BRANCH = f"codex/attr-{datetime.date.today()}"
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
-
 # Utility functions
 def git(*args):
     subprocess.check_call(["git", *args], cwd=ROOT, stdout=subprocess.DEVNULL)
@@ -84,14 +86,11 @@ def load_product_catalogs() -> List[Dict[str, Any]]:
                                 value = None
                                 unit = None
                                 
-                                # Match patterns like '45 ft (13.72 m)' or '500 lb (227 kg)'
-                                match = re.search(r'(\d+(?:\.\d+)?)\s*([a-zA-Z]+(?:\s[a-zA-Z]+)?)', value_str)
-                                if match:
-                                    try:
-                                        value = float(match.group(1))
-                                        unit = match.group(2)
-                                    except ValueError:
-                                        pass
+                                # First quantity in values like '45 ft (13.72 m)' or '500 lb (227 kg)'
+                                quantities = parse_quantities(value_str)
+                                if quantities:
+                                    value = quantities[0].value
+                                    unit = quantities[0].unit
                                 
                                 # If we couldn't extract a numeric value, just use the string
                                 if value is None:
@@ -319,7 +318,7 @@ def ask_codex(current_attrs: Dict[str, Any], example_attrs: Dict[str, Any],
     )
     
     # Call OpenAI API
-    rsp = openai.ChatCompletion.create(
+    rsp = openai_sdk().ChatCompletion.create(
         model="gpt-4o-preview",
         messages=[
             {"role":"system","content":"You are an expert taxonomy curator for construction equipment."},
@@ -427,8 +426,8 @@ def main():
     }
     
     api = f"https://api.github.com/repos/{repo}"
-    prs = requests.get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
-                       headers=headers, timeout=20).json()
+    prs = http().get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
+                     headers=headers, timeout=20).json()
     
     if prs:
         print("PR already exists; branch just force-pushed.")
@@ -458,7 +457,7 @@ def main():
     )
     
     # Create PR
-    requests.post(
+    http().post(
         f"{api}/pulls",
         headers=headers,
         json={
@@ -6,16 +6,20 @@ Codex attribute proposer:
  • Updates the file, validates, commits, pushes a branch
  • Opens (or updates) a PR via GitHub API
 """
-import json, os, subprocess, datetime, pathlib, requests, openai, sys, re
+import json, os, subprocess, datetime, pathlib, sys, re
 from typing import Any, Dict
 from constants import classify_attr
+from api_clients import chat_completion, http
+from page_source import Page, iter_pages
+from page_reduce import map_reduce_pages
+from page_cache import CachedExtractor, extractor_version
+from quantity import QUANTITY_PATTERN, UNITS, parse_quantities
 
 ROOT       = pathlib.Path(__file__).resolve().parents[1]
 ATTR_FILE  = ROOT / "attributes" / "consolidated_attributes.json"
 CATALOG_DIR = ROOT / "data" / "product_catalogs"
 BRANCH     = f"codex/attr-{datetime.date.today()}"
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
 
 # detect dry-run argument
 DRY_RUN = "--dry-run" in sys.argv
@@ -34,59 +38,71 @@ def ask_codex(prompt: str) -> str:
         {"role": "user", "content": prompt},
     ]
     model_name = os.getenv("OPENAI_MODEL", "gpt-4o")
-    # New client (openai>=1.0) exposes OpenAI class
-    if hasattr(openai, "OpenAI"):
-        client = openai.OpenAI()  # api_key is read from env var
-        rsp = client.chat.completions.create(
-            model=model_name,
-            messages=messages,
-            temperature=0.2,
-            max_tokens=800,
-        )
-        return rsp.choices[0].message.content.strip()
-    # Fallback to old API (<1.0)
-    rsp = openai.ChatCompletion.create(
+    return chat_completion(
         model=model_name,
         messages=messages,
         temperature=0.2,
         max_tokens=800,
-    )
-    return rsp.choices[0].message.content.strip()
+    ).strip()
 
-def extract_specs(text: str):
-    """Parse bullet-list specs from raw catalog text.
+# Bullet-list spec lines
+SPEC_LINE_PATTERN = re.compile(r"^[\*\-]\s*(.+?):\s*(.+)$")
 
-    Recognises leading "*" or "-" and splits lines of the form
-        * Operating Weight: 67,500 lb (30,600 kg)
+# Version of parse_specs' rules for the page cache: bump the revision when its code changes
+PARSE_VERSION = extractor_version(2, SPEC_LINE_PATTERN, QUANTITY_PATTERN, UNITS)
 
-    Returns list of dicts with keys:
-        name, value, unit, alt_value, alt_unit (alt_* optional).
+def parse_specs(text: str):
+    """Parse bullet-list specs from raw catalog text, before categorisation.
+
+    Returns a list of [spec, rhs] pairs: the spec dict without "category"
+    and the value text it was parsed from.
     """
-    specs = []
-    bullet_pat = re.compile(r"^[\*\-]\s*(.+?):\s*(.+)$")
-    unit_pat  = re.compile(r"(?P<val>[\d,\.]+)\s*(?P<unit>[a-zA-Z/%]+)")
+    parsed = []
     for line in text.splitlines():
-        m = bullet_pat.match(line.strip())
+        m = SPEC_LINE_PATTERN.match(line.strip())
         if not m:
             continue
         name, rhs = m.groups()
-        # primary number + unit
-        primary = unit_pat.search(rhs)
-        alt = None
-        if "(" in rhs and ")" in rhs:
-            inside = rhs[rhs.find("(")+1:rhs.rfind(")")]
-            alt = unit_pat.search(inside)
+        # primary quantity, and the same restated in parentheses
+        # (compound values such as "24 ft 1 in" are one quantity)
+        quantities = parse_quantities(rhs)
+        stated = [q for q in quantities if not q.alternate]
+        alt = next((q for q in quantities if q.alternate), None)
         spec = {"name": name.strip()}
-        if primary:
-            spec["value"] = float(primary.group("val").replace(',', '')) if primary.group("val") else None
-            spec["unit"] = primary.group("unit")
+        if stated:
+            spec["value"] = stated[0].value
+            spec["unit"] = stated[0].unit
         if alt:
-            spec["alt_value"] = float(alt.group("val").replace(',', ''))
-            spec["alt_unit"] = alt.group("unit")
-        # determine category using heuristics
-        spec["category"] = classify_attr(name, rhs)
-        specs.append(spec)
-    return specs
+            spec["alt_value"] = alt.value
+            spec["alt_unit"] = alt.unit
+        if len(stated) > 1:
+            # e.g. "18 V 12.0 Ah / 54 V 4.0 Ah"
+            spec["values"] = [{"value": q.value, "unit": q.unit} for q in stated]
+        parsed.append([spec, rhs])
+    return parsed
+
+def categorise_specs(parsed):
+    """Add the heuristic "category" to parse_specs results."""
+    return [dict(spec, category=classify_attr(spec["name"], rhs)) for spec, rhs in parsed]
+
+def extract_specs(text: str):
+    """Parse bullet-list specs from raw catalog text.
+
+    Recognises leading "*" or "-" and splits lines of the form
+        * Operating Weight: 67,500 lb (30,600 kg)
+
+    Returns list of dicts with keys:
+        name, value, unit, alt_value, alt_unit (alt_* optional),
+        values (every quantity, when there are several), category.
+    """
+    return categorise_specs(parse_specs(text))
+
+def page_specs(page: Page, parsed=None):
+    """extract_specs for one catalog page, from its parse_specs result if given.
+
+    Lists of specs merge by concatenation.
+    """
+    return categorise_specs(parse_specs(page.text) if parsed is None else parsed)
 
 def build_prompt(current_attrs, specs):
     schema_reminder = (
@@ -128,11 +144,11 @@ def propose(dry: bool = False):
     data = load_attributes()
     existing = set(data["attributes"].keys())
 
-    # parse ALL catalog pages under data/product_catalogs
-    texts = [p.read_text(errors="ignore") for p in CATALOG_DIR.rglob("*.txt")]
-    specs = []
-    for txt in texts:
-        specs.extend(extract_specs(txt))
+    # parse ALL catalog pages under data/product_catalogs, in worker processes
+    # only pages not parsed before (by the same PARSE_VERSION) are parsed again
+    pages = iter_pages(CATALOG_DIR, recursive=True, errors="ignore")
+    extract = CachedExtractor("populate_specs", PARSE_VERSION, parse_specs, page_specs)
+    specs = map_reduce_pages(extract, pages, list)
 
     prompt = build_prompt(data["attributes"], specs)
     try:
@@ -208,8 +224,8 @@ def main():
     }
     api = f"https://api.github.com/repos/{repo}"
     # check existing PR
-    prs = requests.get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
-                       headers=headers, timeout=20).json()
+    prs = http().get(f"{api}/pulls?head={repo.split('/')[0]}:{BRANCH}",
+                     headers=headers, timeout=20).json()
     if prs:
         print("PR already exists; branch just force-pushed.")
         return
@@ -217,15 +233,15 @@ def main():
             "Automated PR adding new attribute definitions suggested by Codex.\n\n"
             "- [ ] Human review required (>=1 CODEOWNER)\n"
             "- Source: LLM (Codex)\n")
-    requests.post(f"{api}/pulls",
-                  headers=headers,
-                  json={
-                      "title": "feat: Codex attribute update",
-                      "head": BRANCH,
-                      "base": "main",
-                      "body": body,
-                      "maintainer_can_modify": True
-                  },
-                  timeout=20)
+    http().post(f"{api}/pulls",
+                headers=headers,
+                json={
+                    "title": "feat: Codex attribute update",
+                    "head": BRANCH,
+                    "base": "main",
+                    "body": body,
+                    "maintainer_can_modify": True
+                },
+                timeout=20)
 if __name__ == "__main__":
     main()
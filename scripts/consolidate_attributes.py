@@ -2,79 +2,273 @@
 """
 Attribute Consolidation Script
 
-Consolidates individual attribute files into a single consolidated JSON file.
+Consolidates individual attribute files into a single consolidated JSON file,
+plus a memory-mappable binary copy (see binary_library.py). Attributes are
+written in sorted code order as a stream, so identical inputs always give
+byte-identical output whatever the filesystem order. --compact drops all
+whitespace.
+
+With --shards, the library is also split into one file per
+category/subcategory under attributes/consolidated/shards/, with an
+index.json mapping each code to its shard and holding each shard's hash,
+so consumers can load and cache-invalidate only the shards they use.
+Shards are build output and are not committed (the directory is ignored
+by git); regenerate them where they are needed.
+
+With --incremental, a sidecar manifest next to the output records each
+attribute file's stat info, hash and consolidated entry. Only added or
+changed files are re-parsed.
+
+Output files are never rewritten when they would be byte-identical.
 
 Run this script from the root of the repository:
   python scripts/consolidate_attributes.py
+  python scripts/consolidate_attributes.py --incremental
+  python scripts/consolidate_attributes.py --shards
 """
 
+import argparse
+import hashlib
 import json
 import os
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from binary_library import binary_path, encode_library
+from taxonomy_loader import (
+    CONSOLIDATED_FIELDS,
+    iter_attribute_records,
+    read_files,
+    scan_attribute_files,
+    to_consolidated,
+)
 
 # Define the repository root and attributes paths
 ROOT = Path(__file__).resolve().parents[1]
 ATTR_DIR = ROOT / "attributes"
-NEW_PHYSICS_DIR = ATTR_DIR / "physics"
-NEW_BRAND_DIR = ATTR_DIR / "brand"
 CONSOLIDATED_DIR = ATTR_DIR / "consolidated"
 CONSOLIDATED_FILE = CONSOLIDATED_DIR / "consolidated_attributes.json"
 
-def consolidate_attributes():
-    """Consolidate individual attribute files into a single file."""
-    consolidated = {"attributes": {}}
-    
-    # Process physics attributes
-    for subdir in NEW_PHYSICS_DIR.iterdir():
-        if subdir.is_dir():
-            for attr_file in subdir.glob("*.json"):
-                with open(attr_file, 'r') as f:
-                    attr_data = json.load(f)
-                
-                # Extract the core attribute data for consolidated file
-                attr_code = attr_data["code"]
-                consolidated_attr = {
-                    "name": attr_data["name"],
-                    "type": attr_data["type"],
-                    "category": attr_data["category"]
-                }
-                
-                # Add optional fields
-                if "unit" in attr_data:
-                    consolidated_attr["unit"] = attr_data["unit"]
-                if "description" in attr_data:
-                    consolidated_attr["description"] = attr_data["description"]
-                
-                consolidated["attributes"][attr_code] = consolidated_attr
-    
-    # Process brand attributes
-    for subdir in NEW_BRAND_DIR.iterdir():
-        if subdir.is_dir():
-            for attr_file in subdir.glob("*.json"):
-                with open(attr_file, 'r') as f:
-                    attr_data = json.load(f)
-                
-                # Extract the core attribute data for consolidated file
-                attr_code = attr_data["code"]
-                consolidated_attr = {
-                    "name": attr_data["name"],
-                    "type": attr_data["type"],
-                    "category": attr_data["category"]
-                }
-                
-                # Add optional fields
-                if "unit" in attr_data:
-                    consolidated_attr["unit"] = attr_data["unit"]
-                if "description" in attr_data:
-                    consolidated_attr["description"] = attr_data["description"]
-                
-                consolidated["attributes"][attr_code] = consolidated_attr
-    
-    # Write the consolidated file
-    with open(CONSOLIDATED_FILE, 'w') as f:
-        json.dump(consolidated, f, indent=2)
-    
-    print(f"Created consolidated file with {len(consolidated['attributes'])} attributes")
+# Name of the incremental manifest, stored next to the consolidated file
+MANIFEST_NAME = ".consolidate_manifest.json"
+MANIFEST_VERSION = 1
+
+# Hash of the fields to_consolidated keeps; cached entries of another projection are stale
+PROJECTION = hashlib.sha256(json.dumps(CONSOLIDATED_FIELDS).encode()).hexdigest()[:16]
+
+# Name of the shard index, stored in the shard directory
+SHARD_INDEX_NAME = "index.json"
+SHARD_INDEX_VERSION = 1
+
+def manifest_path(output_file):
+    """Path of the incremental manifest for an output file."""
+    return Path(output_file).with_name(MANIFEST_NAME)
+
+def load_manifest(path) -> Optional[Dict[str, Any]]:
+    """Load an incremental manifest, or None if it is missing, unreadable, from another
+    version or cached under another set of consolidated fields."""
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("projection") != PROJECTION):
+        return None
+    return manifest
+
+def write_manifest(path, manifest):
+    # Keys are not sorted: cached entries must keep their field order
+    tmp_path = Path(path).with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+def write_if_changed(path, data: bytes) -> bool:
+    """Write `data` to `path` unless the file already holds exactly those bytes."""
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def iter_library_json(attributes: Iterable[Tuple[str, Dict[str, Any]]], compact: bool = False) -> Iterator[str]:
+    """Serialize (code, attribute) pairs as a consolidated library, one chunk per attribute.
+
+    The indented form is byte-for-byte what json.dump(..., indent=2) writes
+    for the same dict; the compact form has no whitespace at all.
+    """
+    if compact:
+        yield '{"attributes":{'
+        separator = ""
+        for code, attr in attributes:
+            yield f'{separator}{json.dumps(code)}:{json.dumps(attr, separators=(",", ":"))}'
+            separator = ","
+        yield "}}"
+        return
+    empty = True
+    for code, attr in attributes:
+        opening = '{\n  "attributes": {\n' if empty else ",\n"
+        yield f'{opening}    {json.dumps(code)}: ' + json.dumps(attr, indent=2).replace("\n", "\n    ")
+        empty = False
+    yield '{\n  "attributes": {}\n}' if empty else "\n  }\n}"
+
+def write_library(path, attributes: Dict[str, Dict[str, Any]], compact: bool = False) -> Tuple[bool, str]:
+    """Stream a library to `path` in sorted code order, leaving the file alone if it is unchanged.
+
+    The serialized library is hashed first and compared with the existing
+    file; only a changed library is streamed to a temporary file and moved
+    into place. It is never held in memory. Returns (written, sha256).
+    """
+    path = Path(path)
+
+    def chunks():
+        for chunk in iter_library_json(((code, attributes[code]) for code in sorted(attributes)), compact):
+            yield chunk.encode()
+
+    digest = hashlib.sha256()
+    size = 0
+    for data in chunks():
+        digest.update(data)
+        size += len(data)
+    if path.exists() and path.stat().st_size == size and file_digest(path) == digest.hexdigest():
+        return False, digest.hexdigest()
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.writelines(chunks())
+    os.replace(tmp_path, path)
+    return True, digest.hexdigest()
+
+def file_digest(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_shards(shard_dir, attributes, shard_of, compact=False):
+    """Write one consolidated file per shard plus the shard index.
+
+    `shard_of` maps each code to its "<category>/<subcategory>" shard.
+    Unchanged shards are not rewritten, and shards that no longer exist
+    are removed along with their emptied category directories. Returns the number of shard files written.
+    """
+    shard_dir = Path(shard_dir)
+    shards = {}
+    for code, attr in attributes.items():
+        shards.setdefault(shard_of[code], {})[code] = attr
+
+    index = {"version": SHARD_INDEX_VERSION, "shards": {}, "codes": {}}
+    written = 0
+    for shard in sorted(shards):
+        shard_file = shard_dir / f"{shard}.json"
+        shard_file.parent.mkdir(parents=True, exist_ok=True)
+        changed, digest = write_library(shard_file, shards[shard], compact)
+        written += changed
+        index["shards"][shard] = {"file": f"{shard}.json", "sha256": digest, "count": len(shards[shard])}
+        index["codes"].update(dict.fromkeys(sorted(shards[shard]), shard))
+
+    for shard_file in shard_dir.glob("*/*.json"):
+        if shard_file.relative_to(shard_dir).with_suffix("").as_posix() not in shards:
+            shard_file.unlink()
+            # Drop the category directory with its last shard
+            if not any(shard_file.parent.iterdir()):
+                shard_file.parent.rmdir()
+    write_if_changed(shard_dir / SHARD_INDEX_NAME, json.dumps(index, indent=2).encode())
+    return written
+
+def collect_incremental(attr_dir, previous):
+    """Build the consolidated map, re-parsing only files that changed since `previous`.
+
+    Files whose size and mtime match the manifest are reused as-is; files
+    that were touched but hash the same are reused too. Returns the
+    consolidated map, the new manifest entries and the number of files parsed.
+    """
+    scanned = []
+    for attr_file in scan_attribute_files(attr_dir):
+        rel = attr_file.path.relative_to(attr_dir).as_posix()
+        entry = previous.get(rel)
+        stat = attr_file.stat
+        stale = entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns
+        scanned.append((attr_file, rel, entry, stale))
+
+    # Stale files are read concurrently, in the same order they are consumed below
+    reads = read_files(attr_file.path for attr_file, _, _, stale in scanned if stale)
+    attributes = {}
+    files = {}
+    parsed = 0
+    for attr_file, rel, entry, stale in scanned:
+        if stale:
+            _, raw = next(reads)
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is None or entry["sha256"] != digest:
+                data = json.loads(raw)
+                entry = {"code": data["code"], "entry": to_consolidated(data)}
+                parsed += 1
+            stat = attr_file.stat
+            entry = {**entry, "sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        files[rel] = entry
+        attributes[entry["code"]] = entry["entry"]
+    return attributes, files, parsed
+
+def consolidate_attributes(attr_dir=ATTR_DIR, output_file=CONSOLIDATED_FILE, incremental=False,
+                           shard_dir=None, compact=False):
+    """Consolidate individual attribute files into a single file (and optionally shards)."""
+    attr_dir = Path(attr_dir)
+    if incremental:
+        manifest_file = manifest_path(output_file)
+        manifest = load_manifest(manifest_file)
+        previous = manifest["files"] if manifest else {}
+        attributes, files, parsed = collect_incremental(attr_dir, previous)
+        # rel paths are "<category>/<subcategory>/<code>.json"
+        shard_of = {entry["code"]: rel.rsplit("/", 1)[0] for rel, entry in files.items()}
+    else:
+        attributes = {}
+        shard_of = {}
+        # Process physics and brand attributes in a single walk of the tree
+        for record in iter_attribute_records(attr_dir):
+            # Extract the core attribute data for consolidated file
+            attributes[record.data["code"]] = to_consolidated(record.data)
+            shard_of[record.data["code"]] = f"{record.category}/{record.subcategory}"
+
+    # Write the consolidated file and its binary copy; identical output is not rewritten
+    written, _ = write_library(output_file, attributes, compact)
+    write_if_changed(binary_path(output_file), encode_library(attributes))
+
+    if incremental:
+        if manifest is None or files != previous:
+            write_manifest(manifest_file, {"version": MANIFEST_VERSION, "projection": PROJECTION, "files": files})
+        status = "updated" if written else "unchanged"
+        print(f"Consolidated file {status} with {len(attributes)} attributes "
+              f"({parsed} parsed, {len(previous.keys() - files.keys())} removed)")
+    else:
+        print(f"Created consolidated file with {len(attributes)} attributes")
+
+    if shard_dir is not None:
+        written = write_shards(shard_dir, attributes, shard_of, compact)
+        print(f"Updated {written} shard(s) in {shard_dir}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Consolidate individual attribute files.")
+    parser.add_argument("--root", type=Path, default=ROOT,
+                        help="taxonomy root to consolidate (default: this repository)")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"re-parse only attribute files changed since the last run (tracked in {MANIFEST_NAME})")
+    parser.add_argument("--compact", action="store_true",
+                        help="write the library (and shards) without whitespace")
+    parser.add_argument("--shards", action="store_true",
+                        help="also write per-category/subcategory shards to attributes/consolidated/shards/")
+    args = parser.parse_args(argv)
+    attr_dir = args.root / "attributes"
+    consolidated_dir = attr_dir / "consolidated"
+    consolidate_attributes(attr_dir, consolidated_dir / "consolidated_attributes.json",
+                           incremental=args.incremental,
+                           shard_dir=consolidated_dir / "shards" if args.shards else None,
+                           compact=args.compact)
 
 if __name__ == "__main__":
-    consolidate_attributes()
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+"""
+SQLite Taxonomy Export
+
+Exports the taxonomy into an indexed SQLite database for ad-hoc queries:
+
+  attributes           one row per attribute definition
+  categories           one row per category node, with its full path
+  category_closure     every (ancestor, descendant) pair, including each node with itself
+  category_attributes  attribute refs on categories with their commonality_threshold
+  products             example products (and any --products NDJSON feeds)
+  product_values       one row per product attribute value (JSON-encoded), with
+                       numeric physics values also converted to SI (si_value)
+
+Run this script from the root of the repository:
+  python scripts/export_sqlite.py --output taxonomy.db
+  python scripts/export_sqlite.py --db taxonomy.db --requiring battery_voltage --min-threshold 80
+  python scripts/export_sqlite.py --db taxonomy.db --query "SELECT code FROM attributes WHERE subcategory = 'identification'"
+"""
+
+import argparse
+import json
+import math
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from quantity import to_si_batch, unit_info
+from taxonomy_loader import iter_attribute_records, to_consolidated
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DB = ROOT / "taxonomy.db"
+
+# Separator between names in a category path, as in validation messages
+PATH_SEPARATOR = " > "
+
+# Product values converted to SI and inserted together
+VALUE_BATCH = 10_000
+
+SCHEMA_SQL = """
+CREATE TABLE attributes (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    subcategory TEXT NOT NULL,
+    unit TEXT,
+    si_unit TEXT,
+    description TEXT
+);
+CREATE INDEX attributes_category ON attributes (category, subcategory);
+
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    parent_id INTEGER REFERENCES categories (id),
+    depth INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    is_leaf INTEGER NOT NULL,
+    source_file TEXT NOT NULL
+);
+CREATE INDEX categories_name ON categories (name);
+CREATE INDEX categories_path ON categories (path);
+
+CREATE TABLE category_closure (
+    ancestor_id INTEGER NOT NULL REFERENCES categories (id),
+    descendant_id INTEGER NOT NULL REFERENCES categories (id),
+    distance INTEGER NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id)
+) WITHOUT ROWID;
+CREATE INDEX category_closure_descendant ON category_closure (descendant_id, ancestor_id);
+
+CREATE TABLE category_attributes (
+    category_id INTEGER NOT NULL REFERENCES categories (id),
+    attribute_code TEXT NOT NULL,
+    commonality_threshold INTEGER NOT NULL,
+    PRIMARY KEY (category_id, attribute_code)
+) WITHOUT ROWID;
+CREATE INDEX category_attributes_code ON category_attributes (attribute_code, commonality_threshold);
+
+CREATE TABLE products (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    source TEXT,
+    status TEXT,
+    origin TEXT NOT NULL
+);
+CREATE INDEX products_category ON products (category);
+
+CREATE TABLE product_values (
+    product_id INTEGER NOT NULL REFERENCES products (id),
+    position INTEGER NOT NULL,
+    attribute_code TEXT NOT NULL,
+    value TEXT NOT NULL,
+    si_value REAL,
+    PRIMARY KEY (product_id, position)
+) WITHOUT ROWID;
+CREATE INDEX product_values_code ON product_values (attribute_code, si_value);
+"""
+
+
+def walk_categories(tree: Dict[str, Any]) -> Iterator[Tuple[List[str], Dict[str, Any]]]:
+    """Yield (path of names, node) for every node of a category tree, parents first."""
+    stack = [([tree["name"]], tree)]
+    while stack:
+        names, node = stack.pop()
+        yield names, node
+        for child in reversed(node.get("subcategories", [])):
+            stack.append((names + [child["name"]], child))
+
+
+def si_unit(attr: Dict[str, Any]) -> Optional[str]:
+    """The SI unit a physics attribute's values convert to, or None."""
+    info = unit_info(attr.get("unit")) if attr.get("category") == "physics" else None
+    return info.si_unit if info is not None else None
+
+
+def insert_attributes(conn: sqlite3.Connection, attr_dir: Path) -> int:
+    rows = (
+        (record.data["code"], attr["name"], attr["type"], attr["category"], record.subcategory,
+         attr.get("unit"), si_unit(attr), attr.get("description"))
+        for record in iter_attribute_records(attr_dir)
+        for attr in (to_consolidated(record.data),)
+    )
+    conn.executemany("INSERT OR REPLACE INTO attributes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    return conn.execute("SELECT COUNT(*) FROM attributes").fetchone()[0]
+
+
+def insert_categories(conn: sqlite3.Connection, categories_dir: Path) -> int:
+    count = 0
+    for file_path in sorted(categories_dir.glob("*.json")):
+        with open(file_path, 'r') as f:
+            tree = json.load(f)
+        ids = {}
+        for names, node in walk_categories(tree):
+            path = PATH_SEPARATOR.join(names)
+            if path in ids:
+                raise ValueError(f"duplicate category path '{path}' in {file_path.name}")
+            parent_id = ids.get(PATH_SEPARATOR.join(names[:-1])) if len(names) > 1 else None
+            cursor = conn.execute(
+                "INSERT INTO categories (name, parent_id, depth, path, is_leaf, source_file) VALUES (?, ?, ?, ?, ?, ?)",
+                (node["name"], parent_id, len(names) - 1, path, "subcategories" not in node, file_path.name))
+            node_id = ids[path] = cursor.lastrowid
+            # A node's ancestors are its parent's ancestors plus itself
+            conn.execute("INSERT INTO category_closure VALUES (?, ?, 0)", (node_id, node_id))
+            if parent_id is not None:
+                conn.execute("INSERT INTO category_closure "
+                             "SELECT ancestor_id, ?, distance + 1 FROM category_closure WHERE descendant_id = ?",
+                             (node_id, parent_id))
+            conn.executemany("INSERT OR REPLACE INTO category_attributes VALUES (?, ?, ?)",
+                             ((node_id, ref["ref"], ref["commonality_threshold"])
+                              for ref in node.get("attributes", [])))
+            count += 1
+    return count
+
+
+def iter_product_sources(examples_dir: Path, feeds: Sequence[Path]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (origin, product) from examples/*.json and then each NDJSON feed."""
+    for file_path in sorted(examples_dir.glob("*.json")):
+        with open(file_path, 'r') as f:
+            yield file_path.name, json.load(f)
+    for feed in feeds:
+        with open(feed, 'rb') as f:
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    yield f"{Path(feed).name}:{lineno}", json.loads(line)
+
+
+def insert_values(conn: sqlite3.Connection, rows: List[Tuple[int, int, str, Any]], units: Dict[str, str]) -> None:
+    """Insert (product_id, position, code, value) rows, converting their values to SI in one batch."""
+    if not rows:
+        return
+    si_values, _ = to_si_batch([row[3] for row in rows], [units.get(row[2]) for row in rows])
+    conn.executemany("INSERT INTO product_values VALUES (?, ?, ?, ?, ?)",
+                     ((product_id, position, code, json.dumps(value), None if math.isnan(si) else si)
+                      for (product_id, position, code, value), si in zip(rows, si_values)))
+
+
+def insert_products(conn: sqlite3.Connection, examples_dir: Path, feeds: Sequence[Path] = ()) -> int:
+    # Units of the physics attributes, whose numeric values are also stored in SI
+    units = dict(conn.execute("SELECT code, unit FROM attributes WHERE category = 'physics' AND unit IS NOT NULL"))
+    count = 0
+    rows = []
+    for origin, product in iter_product_sources(examples_dir, feeds):
+        cursor = conn.execute(
+            "INSERT INTO products (name, category, source, status, origin) VALUES (?, ?, ?, ?, ?)",
+            (product["name"], product["category"], product.get("source"), product.get("status"), origin))
+        rows.extend((cursor.lastrowid, i, entry["attribute"], entry["value"])
+                    for i, entry in enumerate(product["attributes"]))
+        if len(rows) >= VALUE_BATCH:
+            insert_values(conn, rows, units)
+            rows = []
+        count += 1
+    insert_values(conn, rows, units)
+    return count
+
+
+def export_taxonomy(root: Path = ROOT, db_path: Path = DEFAULT_DB, feeds: Sequence[Path] = ()) -> Dict[str, int]:
+    """Export the taxonomy under `root` into a new SQLite database at `db_path`."""
+    root = Path(root)
+    db_path = Path(db_path)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA_SQL)
+        with conn:
+            counts = {
+                "attributes": insert_attributes(conn, root / "attributes"),
+                "categories": insert_categories(conn, root / "categories"),
+                "products": insert_products(conn, root / "examples", feeds),
+            }
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    tmp_path.replace(db_path)
+    return counts
+
+
+# --- query helper -----------------------------------------------------------
+
+def connect(db_path: Path = DEFAULT_DB) -> sqlite3.Connection:
+    """Open an exported database read-only, with rows addressable by column name."""
+    conn = sqlite3.connect(f"file:{Path(db_path)}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def query(conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+    """Run a read-only query and return all rows."""
+    return conn.execute(sql, params).fetchall()
+
+
+def leaf_categories_requiring(conn: sqlite3.Connection, code: str, min_threshold: int = 0,
+                              under: Optional[str] = None) -> List[sqlite3.Row]:
+    """Leaf categories that reference `code` with at least `min_threshold` commonality.
+
+    With `under`, only leaves below (or equal to) the category at that path.
+    """
+    sql = ("SELECT c.path, ca.commonality_threshold FROM category_attributes ca "
+           "JOIN categories c ON c.id = ca.category_id ")
+    params = [code, min_threshold]
+    if under is not None:
+        sql += ("JOIN category_closure cc ON cc.descendant_id = c.id "
+                "JOIN categories a ON a.id = cc.ancestor_id AND a.path = ? ")
+        params.insert(0, under)
+    sql += "WHERE ca.attribute_code = ? AND ca.commonality_threshold >= ? AND c.is_leaf ORDER BY c.path"
+    return query(conn, sql, params)
+
+
+def attributes_in(conn: sqlite3.Connection, category: str, subcategory: Optional[str] = None) -> List[sqlite3.Row]:
+    """Attributes in an attribute category (physics/brand), optionally one subcategory."""
+    if subcategory is None:
+        return query(conn, "SELECT * FROM attributes WHERE category = ? ORDER BY code", (category,))
+    return query(conn, "SELECT * FROM attributes WHERE category = ? AND subcategory = ? ORDER BY code",
+                 (category, subcategory))
+
+
+def print_rows(rows: List[sqlite3.Row]) -> None:
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the taxonomy to SQLite, or query an export.")
+    parser.add_argument("--root", type=Path, default=ROOT,
+                        help="taxonomy root to export (default: this repository)")
+    parser.add_argument("--output", type=Path, help="export to this database file")
+    parser.add_argument("--products", nargs="+", type=Path, default=[], metavar="FEED",
+                        help="also export products from NDJSON/JSONL feeds")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="database to query (default: taxonomy.db)")
+    parser.add_argument("--query", metavar="SQL", help="run a query and print the rows")
+    parser.add_argument("--requiring", metavar="CODE", help="list leaf categories that reference an attribute")
+    parser.add_argument("--min-threshold", type=int, default=0,
+                        help="minimum commonality_threshold for --requiring (default: 0)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        counts = export_taxonomy(args.root, args.output, args.products)
+        print(f"Exported {counts['attributes']} attributes, {counts['categories']} categories "
+              f"and {counts['products']} products to {args.output}")
+    if args.query or args.requiring:
+        conn = connect(args.output or args.db)
+        try:
+            if args.query:
+                print_rows(query(conn, args.query))
+            if args.requiring:
+                print_rows(leaf_categories_requiring(conn, args.requiring, args.min_threshold))
+        finally:
+            conn.close()
+    elif not args.output:
+        parser.error("nothing to do: pass --output to export, or --query/--requiring to query")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
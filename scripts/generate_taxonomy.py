@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Synthetic Taxonomy Generator
+
+Generates a taxonomy with the same layout as this repository (schema/,
+attributes/<category>/<subcategory>/, attributes/consolidated/, categories/,
+examples/) at a configurable scale, plus the same products as an NDJSON
+corpus. Output is deterministic for a given seed.
+
+Run this script from the root of the repository:
+  python scripts/generate_taxonomy.py /tmp/taxonomy --attributes 5000 --depth 4 --fanout 5 --products 100000
+"""
+
+import argparse
+import json
+import random
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from consolidate_attributes import consolidate_attributes
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_DIR = ROOT / "schema"
+
+# Units used for generated physics attributes in each subcategory
+PHYSICS_SUBCATEGORY_UNITS = {
+    "dimensions": ["ft", "in", "m"],
+    "mass": ["lb", "kg"],
+    "electrical": ["V", "A"],
+    "performance": ["hp", "kW", "psi"],
+}
+BRAND_SUBCATEGORIES = ["identification", "specifications"]
+
+# Share of generated attributes that are physics attributes
+PHYSICS_SHARE = 0.7
+
+# Number of attribute refs on each leaf category
+LEAF_ATTRIBUTES = (5, 15)
+
+GENERATED_DATE = "2025-05-25"
+
+# Written into every generated tree; only such trees are replaced without --force
+MARKER_FILE = ".generated_taxonomy"
+
+
+def generate_attributes(count: int, rng: random.Random) -> Dict[str, Dict[str, Any]]:
+    """Generate `count` per-attribute records keyed by code."""
+    attributes = {}
+    for i in range(count):
+        if rng.random() < PHYSICS_SHARE:
+            subcategory = rng.choice(sorted(PHYSICS_SUBCATEGORY_UNITS))
+            code = f"{subcategory}_measure_{i:06d}"
+            attr = {
+                "code": code,
+                "name": f"{subcategory.title()} Measure {i}",
+                "type": "number",
+                "category": "physics",
+                "subcategory": subcategory,
+                "added_date": GENERATED_DATE,
+                "last_modified": GENERATED_DATE,
+                "unit": rng.choice(PHYSICS_SUBCATEGORY_UNITS[subcategory]),
+            }
+        else:
+            subcategory = rng.choice(BRAND_SUBCATEGORIES)
+            code = f"{subcategory}_label_{i:06d}"
+            attr = {
+                "code": code,
+                "name": f"{subcategory.title()} Label {i}",
+                "type": rng.choice(["string", "string", "boolean"]),
+                "category": "brand",
+                "subcategory": subcategory,
+                "added_date": GENERATED_DATE,
+                "last_modified": GENERATED_DATE,
+            }
+        attributes[code] = attr
+    return attributes
+
+
+def write_attributes(root: Path, attributes: Dict[str, Dict[str, Any]]) -> None:
+    """Write one file per attribute under attributes/<category>/<subcategory>/."""
+    for code, attr in attributes.items():
+        dest_dir = root / "attributes" / attr["category"] / attr["subcategory"]
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        with open(dest_dir / f"{code}.json", 'w') as f:
+            json.dump(attr, f, indent=2)
+
+
+def generate_category_tree(name: str, depth: int, fanout: int, codes: List[str],
+                           rng: random.Random) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Generate a category tree of the given depth and fan-out.
+
+    Returns the tree and its leaf nodes; leaves carry the attribute refs.
+    """
+    node = {"name": name}
+    if depth == 0:
+        count = min(len(codes), rng.randint(*LEAF_ATTRIBUTES))
+        node["attributes"] = [
+            {"ref": code, "commonality_threshold": rng.choice([60, 80, 100])}
+            for code in rng.sample(codes, count)
+        ]
+        return node, [node]
+    node["subcategories"] = []
+    leaves = []
+    for i in range(fanout):
+        child, child_leaves = generate_category_tree(f"{name}.{i + 1}", depth - 1, fanout, codes, rng)
+        node["subcategories"].append(child)
+        leaves.extend(child_leaves)
+    return node, leaves
+
+
+def generate_value(attr: Dict[str, Any], rng: random.Random) -> Any:
+    """Generate a value of the attribute's declared type."""
+    if attr["type"] == "number":
+        return round(rng.uniform(1, 500), 2)
+    if attr["type"] == "boolean":
+        return rng.random() < 0.5
+    return f"{attr['name']} {rng.randint(1, 999)}"
+
+
+def generate_products(count: int, leaves: List[Dict[str, Any]],
+                      attributes: Dict[str, Dict[str, Any]], rng: random.Random) -> Iterator[Dict[str, Any]]:
+    """Generate products that fill in their leaf category's attributes."""
+    for i in range(count):
+        leaf = rng.choice(leaves)
+        yield {
+            "name": f"Product {i}",
+            "category": leaf["name"],
+            "attributes": [
+                {"attribute": ref["ref"], "value": generate_value(attributes[ref["ref"]], rng)}
+                for ref in leaf["attributes"]
+            ],
+            "source": "tenant_generated",
+            "status": "pending_review",
+        }
+
+
+def generate_taxonomy(root: Path, attributes: int = 1000, depth: int = 3, fanout: int = 5,
+                      products: int = 10000, seed: int = 0, force: bool = False) -> Dict[str, int]:
+    """Generate a complete synthetic taxonomy under `root` and return its counts.
+
+    An existing `root` is replaced only if it is empty, was generated by this
+    script, or `force` is set; otherwise FileExistsError is raised.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    if root.is_dir():
+        if not force and any(root.iterdir()) and not (root / MARKER_FILE).is_file():
+            raise FileExistsError(f"{root} is not empty and was not generated by generate_taxonomy.py "
+                                  "(use --force to replace it)")
+        shutil.rmtree(root)
+    elif root.exists():
+        if not force:
+            raise FileExistsError(f"{root} exists and is not a directory (use --force to replace it)")
+        root.unlink()
+    root.mkdir(parents=True)
+    (root / MARKER_FILE).write_text(f"seed={seed}\n")
+    shutil.copytree(SCHEMA_DIR, root / "schema")
+
+    attrs = generate_attributes(attributes, rng)
+    write_attributes(root, attrs)
+    consolidated_dir = root / "attributes" / "consolidated"
+    consolidated_dir.mkdir(parents=True, exist_ok=True)
+    consolidate_attributes(root / "attributes", consolidated_dir / "consolidated_attributes.json")
+
+    tree, leaves = generate_category_tree("Category", depth, fanout, sorted(attrs), rng)
+    (root / "categories").mkdir()
+    with open(root / "categories" / "synthetic.json", 'w') as f:
+        json.dump(tree, f, indent=2)
+
+    examples_dir = root / "examples"
+    examples_dir.mkdir()
+    with open(root / "products.jsonl", 'w') as feed:
+        for i, product in enumerate(generate_products(products, leaves, attrs, rng)):
+            with open(examples_dir / f"product_{i:07d}.json", 'w') as f:
+                json.dump(product, f, indent=2)
+            feed.write(json.dumps(product) + "\n")
+
+    return {"attributes": len(attrs), "leaf_categories": len(leaves), "products": products}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic taxonomy for benchmarking.")
+    parser.add_argument("output", type=Path, help="directory to create (a previously generated tree is replaced)")
+    parser.add_argument("--attributes", type=int, default=1000, help="number of attributes (default: 1000)")
+    parser.add_argument("--depth", type=int, default=3, help="category tree depth (default: 3)")
+    parser.add_argument("--fanout", type=int, default=5, help="subcategories per category (default: 5)")
+    parser.add_argument("--products", type=int, default=10000, help="number of products (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--force", action="store_true",
+                        help="replace the output even if it is not a generated taxonomy")
+    args = parser.parse_args(argv)
+
+    try:
+        counts = generate_taxonomy(args.output, args.attributes, args.depth, args.fanout, args.products,
+                                   args.seed, args.force)
+    except FileExistsError as e:
+        parser.error(str(e))
+    print(f"Generated {counts['attributes']} attributes, {counts['leaf_categories']} leaf categories "
+          f"and {counts['products']} products in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# Generated by scripts/build_validators.py from schema/*.schema.json -- do not edit.
+# Regenerate with: python scripts/build_validators.py
+
+from numbers import Number as _Number
+
+# SHA-256 of each schema file these validators were generated from
+SCHEMA_HASHES = {
+    'attribute.schema.json': 'f2de5c200f260c269019183e64f9a9225d4f63b63fadbc2f5ee490781e8d231c',
+    'product.schema.json': '059ca5c12e9262cde9d6ee8f11ee82b2f0e8af8d53db1523d4826263ab08dd9a',
+}
+
+
+def is_valid_attribute(instance):
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if 'name' not in instance:
+            return False
+        if 'type' not in instance:
+            return False
+        if 'category' not in instance:
+            return False
+    if isinstance(instance, dict):
+        if 'name' in instance:
+            v1 = instance['name']
+            if not (isinstance(v1, str)):
+                return False
+        if 'type' in instance:
+            v2 = instance['type']
+            if not (isinstance(v2, str)):
+                return False
+            if not (isinstance(v2, str) and v2 in {'boolean', 'number', 'string'}):
+                return False
+        if 'unit' in instance:
+            v3 = instance['unit']
+            if not (isinstance(v3, str)):
+                return False
+        if 'category' in instance:
+            v4 = instance['category']
+            if not (isinstance(v4, str)):
+                return False
+            if not (isinstance(v4, str) and v4 in {'brand', 'physics'}):
+                return False
+        if 'description' in instance:
+            v5 = instance['description']
+            if not (isinstance(v5, str)):
+                return False
+    if isinstance(instance, dict):
+        extras6 = [key for key in instance if key not in {'category', 'description', 'name', 'type', 'unit'}]
+        if extras6:
+            return False
+    return True
+
+
+def iter_errors_attribute(instance):
+    if not (isinstance(instance, dict)):
+        yield (), repr(instance) + " is not of type 'object'"
+    if isinstance(instance, dict):
+        if 'name' not in instance:
+            yield (), "'name' is a required property"
+        if 'type' not in instance:
+            yield (), "'type' is a required property"
+        if 'category' not in instance:
+            yield (), "'category' is a required property"
+    if isinstance(instance, dict):
+        if 'name' in instance:
+            v1 = instance['name']
+            if not (isinstance(v1, str)):
+                yield ('name',), repr(v1) + " is not of type 'string'"
+        if 'type' in instance:
+            v2 = instance['type']
+            if not (isinstance(v2, str)):
+                yield ('type',), repr(v2) + " is not of type 'string'"
+            if not (isinstance(v2, str) and v2 in {'boolean', 'number', 'string'}):
+                yield ('type',), repr(v2) + " is not one of ['string', 'number', 'boolean']"
+        if 'unit' in instance:
+            v3 = instance['unit']
+            if not (isinstance(v3, str)):
+                yield ('unit',), repr(v3) + " is not of type 'string'"
+        if 'category' in instance:
+            v4 = instance['category']
+            if not (isinstance(v4, str)):
+                yield ('category',), repr(v4) + " is not of type 'string'"
+            if not (isinstance(v4, str) and v4 in {'brand', 'physics'}):
+                yield ('category',), repr(v4) + " is not one of ['physics', 'brand']"
+        if 'description' in instance:
+            v5 = instance['description']
+            if not (isinstance(v5, str)):
+                yield ('description',), repr(v5) + " is not of type 'string'"
+    if isinstance(instance, dict):
+        extras6 = [key for key in instance if key not in {'category', 'description', 'name', 'type', 'unit'}]
+        if extras6:
+            extras6.sort(key=str)
+            yield (), 'Additional properties are not allowed (' + ', '.join(map(repr, extras6)) + (' was unexpected)' if len(extras6) == 1 else ' were unexpected)')
+
+
+def is_valid_product(instance):
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if 'name' not in instance:
+            return False
+        if 'category' not in instance:
+            return False
+        if 'attributes' not in instance:
+            return False
+    if isinstance(instance, dict):
+        if 'name' in instance:
+            v1 = instance['name']
+            if not (isinstance(v1, str)):
+                return False
+        if 'category' in instance:
+            v2 = instance['category']
+            if not (isinstance(v2, str)):
+                return False
+        if 'attributes' in instance:
+            v3 = instance['attributes']
+            if not (isinstance(v3, list)):
+                return False
+            if isinstance(v3, list):
+                for i4, v5 in enumerate(v3):
+                    if not (isinstance(v5, dict)):
+                        return False
+                    if isinstance(v5, dict):
+                        if 'attribute' not in v5:
+                            return False
+                        if 'value' not in v5:
+                            return False
+                    if isinstance(v5, dict):
+                        if 'attribute' in v5:
+                            v6 = v5['attribute']
+                            if not (isinstance(v6, str)):
+                                return False
+                    if isinstance(v5, dict):
+                        extras7 = [key for key in v5 if key not in {'attribute', 'value'}]
+                        if extras7:
+                            return False
+        if 'source' in instance:
+            v8 = instance['source']
+            if not (isinstance(v8, str)):
+                return False
+        if 'status' in instance:
+            v9 = instance['status']
+            if not (isinstance(v9, str)):
+                return False
+    if isinstance(instance, dict):
+        extras10 = [key for key in instance if key not in {'attributes', 'category', 'name', 'source', 'status'}]
+        if extras10:
+            return False
+    return True
+
+
+def iter_errors_product(instance):
+    if not (isinstance(instance, dict)):
+        yield (), repr(instance) + " is not of type 'object'"
+    if isinstance(instance, dict):
+        if 'name' not in instance:
+            yield (), "'name' is a required property"
+        if 'category' not in instance:
+            yield (), "'category' is a required property"
+        if 'attributes' not in instance:
+            yield (), "'attributes' is a required property"
+    if isinstance(instance, dict):
+        if 'name' in instance:
+            v1 = instance['name']
+            if not (isinstance(v1, str)):
+                yield ('name',), repr(v1) + " is not of type 'string'"
+        if 'category' in instance:
+            v2 = instance['category']
+            if not (isinstance(v2, str)):
+                yield ('category',), repr(v2) + " is not of type 'string'"
+        if 'attributes' in instance:
+            v3 = instance['attributes']
+            if not (isinstance(v3, list)):
+                yield ('attributes',), repr(v3) + " is not of type 'array'"
+            if isinstance(v3, list):
+                for i4, v5 in enumerate(v3):
+                    if not (isinstance(v5, dict)):
+                        yield ('attributes', i4), repr(v5) + " is not of type 'object'"
+                    if isinstance(v5, dict):
+                        if 'attribute' not in v5:
+                            yield ('attributes', i4), "'attribute' is a required property"
+                        if 'value' not in v5:
+                            yield ('attributes', i4), "'value' is a required property"
+                    if isinstance(v5, dict):
+                        if 'attribute' in v5:
+                            v6 = v5['attribute']
+                            if not (isinstance(v6, str)):
+                                yield ('attributes', i4, 'attribute'), repr(v6) + " is not of type 'string'"
+                    if isinstance(v5, dict):
+                        extras7 = [key for key in v5 if key not in {'attribute', 'value'}]
+                        if extras7:
+                            extras7.sort(key=str)
+                            yield ('attributes', i4), 'Additional properties are not allowed (' + ', '.join(map(repr, extras7)) + (' was unexpected)' if len(extras7) == 1 else ' were unexpected)')
+        if 'source' in instance:
+            v8 = instance['source']
+            if not (isinstance(v8, str)):
+                yield ('source',), repr(v8) + " is not of type 'string'"
+        if 'status' in instance:
+            v9 = instance['status']
+            if not (isinstance(v9, str)):
+                yield ('status',), repr(v9) + " is not of type 'string'"
+    if isinstance(instance, dict):
+        extras10 = [key for key in instance if key not in {'attributes', 'category', 'name', 'source', 'status'}]
+        if extras10:
+            extras10.sort(key=str)
+            yield (), 'Additional properties are not allowed (' + ', '.join(map(repr, extras10)) + (' was unexpected)' if len(extras10) == 1 else ' were unexpected)')
+
+
+# schema file -> (is_valid, iter_errors)
+VALIDATORS = {
+    'attribute.schema.json': (is_valid_attribute, iter_errors_attribute),
+    'product.schema.json': (is_valid_product, iter_errors_product),
+}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Manufacturer Matcher
+
+Finds every mention of a list of manufacturer names in page text with one
+precompiled, case-insensitive pattern. The names are compiled as a trie
+(one alternation per shared prefix), so a single pass over the page finds
+all of them and the work per character does not grow with the list.
+Longer names win over shorter ones starting at the same place.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """A regex matching any of `words`, nested by shared prefix, longest match first."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a word
+
+    def emit(node) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # a word ends here: the longer continuations are optional
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+class ManufacturerMatcher:
+    """Whole-word, case-insensitive matcher for a fixed list of manufacturer names."""
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(dict.fromkeys(names))
+        # Matched text (lower-cased) -> name as listed; the first listing wins
+        self._canonical = {}
+        for name in self.names:
+            self._canonical.setdefault(name.lower(), name)
+        self.pattern = re.compile(r'\b(?:' + trie_pattern(self._canonical) + r')\b', re.IGNORECASE)
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """Every manufacturer mentioned in `text` -> offsets of its mentions, in order of first mention."""
+        positions = {}
+        if not self.names:
+            return positions
+        for match in self.pattern.finditer(text):
+            positions.setdefault(self._canonical[match.group().lower()], []).append(match.start())
+        return positions
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Every manufacturer mentioned in `text` -> number of mentions."""
+        return {name: len(offsets) for name, offsets in self.find_all(text).items()}
+
+    def first_listed(self, text: str) -> Optional[str]:
+        """The earliest-listed manufacturer mentioned in `text`, or None."""
+        found = self.find_all(text)
+        return next((name for name in self.names if name in found), None)
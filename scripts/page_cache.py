@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Page Extraction Cache
+
+Keeps what an extractor found on each catalog page in one SQLite file,
+keyed by the extractor, its version and the SHA-256 of the page text, so
+a run only scans pages that are new or edited since the last run.
+
+An extractor's version is a hash of the rules it applies (compiled
+patterns, keyword lists), so changing any of them misses every cached
+entry, and entries of older versions are dropped on the next run.
+
+The cache file is .page_cache.sqlite at the repository root; set
+PAGE_CACHE to use another file, or to an empty string to disable caching.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from page_source import Page
+
+T = TypeVar("T")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_cache_setting = os.getenv("PAGE_CACHE", str(ROOT / ".page_cache.sqlite"))
+DEFAULT_CACHE_FILE = Path(_cache_setting) if _cache_setting else None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    extractor TEXT NOT NULL,
+    version   TEXT NOT NULL,
+    digest    TEXT NOT NULL,
+    records   TEXT NOT NULL,
+    PRIMARY KEY (extractor, version, digest)
+) WITHOUT ROWID
+"""
+
+# One connection per process and cache file; connections must not cross a fork
+_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+def _canonical(rule: Any) -> Any:
+    if isinstance(rule, re.Pattern):
+        return [rule.pattern, rule.flags]
+    if isinstance(rule, (set, frozenset)):
+        return sorted(_canonical(item) for item in rule)
+    if isinstance(rule, dict):
+        return {str(key): _canonical(value) for key, value in rule.items()}
+    if isinstance(rule, (list, tuple)):
+        return [_canonical(item) for item in rule]
+    return rule
+
+
+def extractor_version(*rules: Any) -> str:
+    """A short hash of the rules an extractor applies: patterns, keyword lists, revision numbers."""
+    encoded = json.dumps([_canonical(rule) for rule in rules], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def page_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _connect(cache_file: Path) -> sqlite3.Connection:
+    key = (os.getpid(), str(cache_file))
+    conn = _connections.get(key)
+    if conn is None:
+        # Workers write one short transaction per batch; others wait for it
+        conn = sqlite3.connect(str(cache_file), timeout=60)
+        conn.execute(SCHEMA)
+        _connections[key] = conn
+    return conn
+
+
+class CachedExtractor(Generic[T]):
+    """A page extractor for map_reduce_pages that reuses cached scans.
+
+    Calling it with a page returns combine(page, scan(page.text)), where the
+    scan comes from the cache when the page text was scanned before by the
+    same extractor version. `scan` must return JSON-serializable records that
+    depend only on the text; whatever depends on the page's source belongs
+    in `combine`. New scans are written by flush(), which map_reduce_pages
+    calls after each batch of pages.
+    """
+
+    def __init__(self, name: str, version: str, scan: Callable[[str], Any],
+                 combine: Callable[[Page, Any], T], cache_file: Optional[Path] = DEFAULT_CACHE_FILE):
+        self.name = name
+        self.version = version
+        self.scan = scan
+        self.combine = combine
+        self.cache_file = cache_file
+        self._pending: List[Tuple[str, str, str, str]] = []
+        if cache_file is not None:
+            self.prune()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_pending"] = []
+        return state
+
+    def __call__(self, page: Page) -> T:
+        if self.cache_file is None:
+            return self.combine(page, self.scan(page.text))
+        digest = page_digest(page.text)
+        row = _connect(self.cache_file).execute(
+            "SELECT records FROM pages WHERE extractor = ? AND version = ? AND digest = ?",
+            (self.name, self.version, digest)).fetchone()
+        if row is not None:
+            records = json.loads(row[0])
+        else:
+            records = self.scan(page.text)
+            self._pending.append((self.name, self.version, digest, json.dumps(records)))
+        return self.combine(page, records)
+
+    def flush(self):
+        """Write the scans made since the last flush to the cache."""
+        if not self._pending:
+            return
+        with _connect(self.cache_file) as conn:
+            conn.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", self._pending)
+        self._pending = []
+
+    def prune(self) -> int:
+        """Drop the entries of other versions of this extractor; returns how many were dropped."""
+        with _connect(self.cache_file) as conn:
+            return conn.execute("DELETE FROM pages WHERE extractor = ? AND version != ?",
+                                (self.name, self.version)).rowcount
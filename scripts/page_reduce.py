@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Page Map-Reduce
+
+Runs a per-page extraction over a stream of catalog pages and combines
+the per-page partial results. Partials are merged with `+=`, which must be
+associative: lists concatenate, and accumulator classes such as the
+attribute tally in codex_enhanced_brand_aware implement __iadd__.
+
+With more than one job, batches of pages are extracted and merged in
+worker processes and the batch results are merged in page order, so the
+result is identical to a serial run. At most a few batches per worker are
+in flight, keeping memory flat on large page streams.
+"""
+
+import os
+from collections import deque
+from functools import partial
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+from page_source import Page
+
+T = TypeVar("T")
+
+# Worker processes for extraction: PAGE_JOBS, or one per CPU (1 = serial)
+DEFAULT_JOBS = int(os.getenv("PAGE_JOBS", "0")) or os.cpu_count() or 1
+
+# Pages per task sent to a worker
+PAGE_BATCH = 32
+
+# Batches in flight per worker
+BATCHES_AHEAD = 2
+
+
+def _reduce_batch(extract: Callable[[Page], T], empty: Callable[[], T], pages: List[Page]) -> T:
+    result = empty()
+    for page in pages:
+        result += extract(page)
+    flush = getattr(extract, "flush", None)
+    if flush is not None:
+        flush()
+    return result
+
+
+def map_reduce_pages(extract: Callable[[Page], T], pages: Iterable[Page], empty: Callable[[], T],
+                     jobs: Optional[int] = None, batch_size: int = PAGE_BATCH) -> T:
+    """Merge `extract(page)` over `pages` in page order, starting from `empty()`.
+
+    `extract` and `empty` must be picklable (module-level) when jobs > 1.
+    If `extract` has a flush() method, such as a page_cache.CachedExtractor,
+    it is called after each batch in the process that ran the batch.
+    Input that fits in one batch is processed serially.
+    """
+    jobs = jobs or DEFAULT_JOBS
+    reduce_batch = partial(_reduce_batch, extract, empty)
+    batches = _batches(pages, batch_size)
+    first = next(batches, None)
+    if first is None:
+        return empty()
+    second = next(batches, None) if jobs > 1 else None
+    if second is None:
+        # Nothing to spread over workers
+        result = reduce_batch(first)
+        for batch in batches:
+            result += reduce_batch(batch)
+        return result
+
+    # Imported here: multiprocessing is slow to import and serial runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+    result = empty()
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for batch in chain((first, second), batches):
+            pending.append(executor.submit(reduce_batch, batch))
+            if len(pending) >= jobs * BATCHES_AHEAD:
+                result += pending.popleft().result()
+        while pending:
+            result += pending.popleft().result()
+    return result
+
+
+def _batches(pages: Iterable[Page], size: int) -> Iterator[List[Page]]:
+    pages = iter(pages)
+    while True:
+        batch = list(islice(pages, size))
+        if not batch:
+            return
+        yield batch
+
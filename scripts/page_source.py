@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Page Source
+
+Streams catalog pages one at a time from
+  - a directory of page files (*.txt), in sorted path order
+  - a single-file catalog dump, with pages separated by form feeds (\\f)
+    or by marker lines such as "=== Page 12 ==="
+
+iter_pages also splits dumps found inside a directory of page files.
+Dumps are memory-mapped and only the page being yielded is decoded, so
+memory use stays flat however many pages a source holds.
+"""
+
+import mmap
+import re
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Optional, Pattern, Union
+
+FORM_FEED = b"\f"
+
+# A whole line such as "=== Page 12 ===", "--- page 3 ---" or "[Page 7]"
+PAGE_MARKER = re.compile(rb"^[ \t]*(?:[=\-#]+|\[)[ \t]*page[ \t]+\d+[ \t]*(?:[=\-#]+|\])[ \t]*\r?$",
+                         re.IGNORECASE | re.MULTILINE)
+
+
+class Page(NamedTuple):
+    """One catalog page."""
+    source: str   # the page file, or "<dump>:<number>" for a page of a dump
+    number: int   # 1-based position of the page within its source
+    text: str
+
+
+# Called with the source of an unreadable page and the error
+ErrorHandler = Callable[[str, Exception], None]
+
+
+def _decode(data: bytes, encoding: str, errors: str) -> str:
+    # Same newline translation as reading a page file in text mode
+    return data.decode(encoding, errors).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def iter_directory_pages(directory: Path, pattern: str = "*.txt", recursive: bool = False,
+                         encoding: str = "utf-8", errors: str = "strict",
+                         on_error: Optional[ErrorHandler] = None, split_dumps: bool = False) -> Iterator[Page]:
+    """Yield each page file under `directory` in sorted path order, reading one at a time.
+
+    A file that cannot be read or decoded is passed to `on_error` with the
+    error and skipped, or raises if no `on_error` is given. With
+    `split_dumps`, files holding form feeds or page marker lines are dumps
+    and their pages are streamed by iter_dump_pages instead.
+    """
+    paths = Path(directory).rglob(pattern) if recursive else Path(directory).glob(pattern)
+    for file_path in sorted(path for path in paths if path.is_file()):
+        text = separator = None
+        try:
+            separator = _dump_separator(file_path) if split_dumps else None
+            if separator is None:
+                text = _decode(file_path.read_bytes(), encoding, errors)
+        except (OSError, UnicodeDecodeError) as e:
+            if on_error is None:
+                raise
+            on_error(str(file_path), e)
+            continue
+        if separator is not None:
+            yield from iter_dump_pages(file_path, separator, encoding, errors, on_error)
+        else:
+            yield Page(str(file_path), 1, text)
+
+
+def iter_dump_pages(dump_file: Path, separator: Union[bytes, Pattern[bytes]] = FORM_FEED,
+                    encoding: str = "utf-8", errors: str = "strict",
+                    on_error: Optional[ErrorHandler] = None) -> Iterator[Page]:
+    """Yield the pages of a single-file dump without reading it into memory.
+
+    `separator` is either a byte string between pages (a form feed by default)
+    or a compiled bytes pattern matching page marker lines, such as
+    PAGE_MARKER. Blank pages are skipped but still counted in page numbers,
+    and a page that cannot be decoded is handled as in iter_directory_pages.
+    """
+    dump_file = Path(dump_file)
+    with dump_file.open("rb") as f:
+        if dump_file.stat().st_size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if isinstance(separator, bytes):
+                bounds = _separator_bounds(mm, separator)
+            else:
+                bounds = _marker_bounds(mm, separator)
+            for number, (start, end) in enumerate(bounds, 1):
+                data = mm[start:end]
+                if not data.strip():
+                    continue
+                source = f"{dump_file}:{number}"
+                try:
+                    text = _decode(data, encoding, errors)
+                except UnicodeDecodeError as e:
+                    if on_error is None:
+                        raise
+                    on_error(source, e)
+                    continue
+                yield Page(source, number, text)
+
+
+def _separator_bounds(mm: mmap.mmap, separator: bytes) -> Iterator[tuple]:
+    start = 0
+    while True:
+        end = mm.find(separator, start)
+        if end < 0:
+            break
+        yield start, end
+        start = end + len(separator)
+    if start < len(mm):
+        yield start, len(mm)
+
+
+def _marker_bounds(mm: mmap.mmap, marker: Pattern[bytes]) -> Iterator[tuple]:
+    start = 0
+    for match in marker.finditer(mm):
+        if match.start() > 0:  # no page before a marker on the first line
+            yield start, match.start()
+        start = match.end()
+    if start < len(mm):
+        yield start, len(mm)
+
+
+def iter_pages(source: Path, **options) -> Iterator[Page]:
+    """Yield the pages of `source`: a directory of page files or a single-file dump.
+
+    Dump files are split on form feeds unless they contain none, in which
+    case PAGE_MARKER lines separate the pages. In a directory, files with
+    form feeds or marker lines are split the same way and other files are
+    one page each. Remaining keyword arguments go to iter_directory_pages
+    or iter_dump_pages.
+    """
+    source = Path(source)
+    if source.is_dir():
+        yield from iter_directory_pages(source, split_dumps=True, **options)
+        return
+    if "separator" not in options:
+        options["separator"] = _dump_separator(source) or PAGE_MARKER
+    yield from iter_dump_pages(source, **options)
+
+
+def _dump_separator(file_path: Path) -> Optional[Union[bytes, Pattern[bytes]]]:
+    """FORM_FEED or PAGE_MARKER if the file is a dump split by them, else None."""
+    if file_path.stat().st_size == 0:
+        return None
+    with file_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(FORM_FEED) >= 0:
+            return FORM_FEED
+        if PAGE_MARKER.search(mm):
+            return PAGE_MARKER
+    return None
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+"""
+Quantity Parser
+
+Parses physical quantities out of spec values and converts them to SI:
+
+  "67,500 lb (30,600 kg)"      67500 lb, then 30600 kg as an alternate
+  "24 ft 1 in (7.34 m)"        24.083 ft (7.341 m), then 7.34 m as an alternate
+  "18 V 12.0 Ah / 54 V 4.0 Ah" 18 V, 12 Ah, 54 V, 4 Ah
+
+The unit lexicon is built from constants.PHYSICS_UNITS plus units common
+in catalogs, with the SI unit of each dimension taken from
+physics_normalizer.STANDARD_UNITS (except kelvin for temperatures and 1/s
+for rotation speeds, which it keeps in °C and rpm) and a precomputed
+factor (and offset, for temperatures) per unit. All units are matched by
+one precompiled pattern, longest unit first. A unit followed by "/" and a
+letter ("kg/m") is part of a compound unit outside the lexicon and is not
+converted.
+
+to_si_batch converts whole columns of values at once, with NumPy when it
+is installed (imported on first use) and in plain Python otherwise.
+"""
+
+import math
+import re
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from constants import PHYSICS_UNITS
+from manufacturer_matcher import trie_pattern
+from physics_normalizer import STANDARD_UNITS
+from value_checks import optional_numpy
+
+class Unit(NamedTuple):
+    """A unit of the lexicon and how to convert it to SI."""
+    symbol: str      # as displayed, e.g. "kW"
+    dimension: str   # a physics_normalizer.STANDARD_UNITS key, e.g. "power"
+    si_unit: str     # e.g. "W"
+    factor: float    # si_value = value * factor + offset
+    offset: float = 0.0
+
+
+# STANDARD_UNITS keys of the PHYSICS_UNITS dimensions that are named differently
+STANDARD_DIMENSIONS = {"mass": "weight", "capacity": "volume"}
+
+# SI units of dimensions that STANDARD_UNITS does not cover, or gives in a non-SI unit
+EXTRA_SI_UNITS = {"charge": "C", "energy": "J", "temperature": "K", "rotation_speed": "1/s"}
+
+# Factor to SI of every PHYSICS_UNITS unit (lower-cased, as listed there)
+SI_FACTORS = {
+    # length -> m
+    "mm": 1e-3, "cm": 1e-2, "m": 1.0, "in": 0.0254, "ft": 0.3048,
+    # mass -> kg
+    "g": 1e-3, "kg": 1.0, "lb": 0.45359237, "ton": 907.18474, "tonne": 1000.0,
+    # force -> N
+    "n": 1.0, "kn": 1e3, "lbf": 4.4482216152605,
+    # power -> W
+    "w": 1.0, "kw": 1e3, "hp": 745.6998715822702,
+    # voltage -> V
+    "v": 1.0, "kv": 1e3,
+    # current -> A
+    "a": 1.0, "ma": 1e-3,
+    # pressure -> Pa
+    "psi": 6894.757293168361, "bar": 1e5, "kpa": 1e3, "mpa": 1e6,
+    # capacity -> m³
+    "l": 1e-3, "gallon": 0.003785411784, "gal": 0.003785411784, "yd³": 0.764554857984, "m³": 1.0,
+}
+
+# Catalog units beyond PHYSICS_UNITS: dimension -> {symbol: factor or (factor, offset)}
+EXTRA_UNITS = {
+    "area": {"m²": 1.0, "ft²": 0.09290304},
+    "speed": {"m/s": 1.0, "km/h": 1 / 3.6, "mph": 0.44704},
+    "rotation_speed": {"rpm": 1 / 60},
+    "torque": {"N·m": 1.0, "ft-lb": 1.3558179483314004, "in-lb": 0.1129848290276167},
+    "flow_rate": {"m³/h": 1 / 3600, "L/min": 1e-3 / 60, "gpm": 0.003785411784 / 60},
+    "frequency": {"Hz": 1.0, "kHz": 1e3},
+    "temperature": {"°C": (1.0, 273.15), "°F": (5 / 9, 273.15 - 160 / 9)},
+    "noise_level": {"dB": 1.0},
+    "time": {"s": 1.0, "min": 60.0, "h": 3600.0},
+    "charge": {"Ah": 3600.0, "mAh": 3.6},
+    "energy": {"Wh": 3600.0, "kWh": 3.6e6, "J": 1.0, "kJ": 1e3},
+}
+
+# How PHYSICS_UNITS units are displayed, where not as listed
+DISPLAY_SYMBOLS = {
+    "n": "N", "kn": "kN", "w": "W", "kw": "kW", "v": "V", "kv": "kV", "a": "A", "ma": "mA",
+    "kpa": "kPa", "mpa": "MPa", "l": "L",
+}
+
+# Other spellings -> lexicon symbol
+ALIASES = {
+    "lbs": "lb", "pound": "lb", "pounds": "lb", "kgs": "kg", "tons": "ton", "tonnes": "tonne",
+    "feet": "ft", "foot": "ft", "'": "ft", "inch": "in", "inches": "in", '"': "in",
+    "liter": "L", "liters": "L", "litre": "L", "litres": "L", "gallons": "gal",
+    "m3": "m³", "yd3": "yd³", "m2": "m²", "ft2": "ft²", "sq ft": "ft²",
+    "nm": "N·m", "n.m": "N·m", "n-m": "N·m", "ft-lbs": "ft-lb", "ft lb": "ft-lb", "lb-ft": "ft-lb",
+    "in-lbs": "in-lb", "kph": "km/h", "km/hr": "km/h", "l/min": "L/min", "lpm": "L/min",
+    "volt": "V", "volts": "V", "amp": "A", "amps": "A", "watt": "W", "watts": "W",
+    "sec": "s", "mins": "min", "hr": "h", "hrs": "h", "db(a)": "dB", "dba": "dB",
+}
+
+# Single-letter units recognized only as written, so "2 a day" is not two amperes
+# and "1.5 M" (million, or mega-) is not metres
+CASE_SENSITIVE_UNITS = ("A", "N", "J", "s", "h", "g", "m")
+
+
+def _build_lexicon() -> Dict[str, Unit]:
+    lexicon = {}
+    for dimension, units in PHYSICS_UNITS.items():
+        standard = STANDARD_DIMENSIONS.get(dimension, dimension)
+        for name in units:
+            lexicon[name.lower()] = Unit(DISPLAY_SYMBOLS.get(name, name), standard,
+                                         EXTRA_SI_UNITS.get(standard) or STANDARD_UNITS[standard],
+                                         SI_FACTORS[name])
+    for dimension, units in EXTRA_UNITS.items():
+        si_unit = EXTRA_SI_UNITS.get(dimension) or STANDARD_UNITS[dimension]
+        for symbol, factor in units.items():
+            factor, offset = factor if isinstance(factor, tuple) else (factor, 0.0)
+            lexicon.setdefault(symbol.lower(), Unit(symbol, dimension, si_unit, factor, offset))
+    for alias, symbol in ALIASES.items():
+        lexicon.setdefault(alias.lower(), lexicon[symbol.lower()])
+    return lexicon
+
+
+# Lower-cased symbol or alias -> Unit
+UNITS = _build_lexicon()
+
+_CASE_SENSITIVE_KEYS = {unit.lower() for unit in CASE_SENSITIVE_UNITS}
+
+_NUMBER = r'[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|[-+]?\.\d+'
+_UNIT = (trie_pattern(key for key in UNITS if key not in _CASE_SENSITIVE_KEYS)
+         + "|(?-i:" + "|".join(CASE_SENSITIVE_UNITS) + ")")
+
+# A number and a lexicon unit after it, not glued to surrounding words and not
+# the start of a compound unit outside the lexicon ("200 kg/m" is not 200 kg)
+QUANTITY_PATTERN = re.compile(rf"(?<![\w.,])(?P<number>{_NUMBER})\s*(?P<unit>{_UNIT})(?![A-Za-z0-9²³]|/[^\W\d_])",
+                              re.IGNORECASE)
+
+
+class Quantity(NamedTuple):
+    """A quantity found in a spec value."""
+    value: float      # in `unit`; compound values such as "24 ft 1 in" are summed into the first unit
+    unit: str
+    dimension: str
+    si_value: float
+    si_unit: str
+    alternate: bool   # given in parentheses, restating the quantity before it
+    start: int
+    end: int
+
+
+def unit_info(unit: Optional[str]) -> Optional[Unit]:
+    """The lexicon entry for a unit symbol or spelling (any case, except the
+    single letters in CASE_SENSITIVE_UNITS), or None."""
+    if not unit:
+        return None
+    unit = unit.strip()
+    if unit.lower() in _CASE_SENSITIVE_KEYS and unit not in CASE_SENSITIVE_UNITS:
+        return None
+    return UNITS.get(unit.lower())
+
+
+def to_si(value: float, unit: Optional[str]) -> Optional[float]:
+    """`value` in `unit` converted to the unit's SI unit, or None for an unknown unit."""
+    info = unit_info(unit)
+    return None if info is None else value * info.factor + info.offset
+
+
+def _matches(text: str) -> Iterator[Tuple[float, Unit, int, int, bool]]:
+    for match in QUANTITY_PATTERN.finditer(text):
+        info = UNITS[match.group("unit").lower()]
+        start = match.start()
+        # Inside parentheses: more "(" than ")" before the match
+        alternate = text.count("(", 0, start) > text.count(")", 0, start)
+        yield float(match.group("number").replace(",", "")), info, start, match.end(), alternate
+
+
+def parse_quantities(text: str) -> List[Quantity]:
+    """Every quantity in `text`, in order.
+
+    Runs of the same dimension separated only by spaces, each in a smaller
+    unit than the one before ("24 ft 1 in", "1 h 30 min"), are one quantity.
+    Temperatures are never combined.
+    """
+    quantities = []
+    run = None  # [value, unit, si_value, alternate, start, end] of the quantity being built
+    for value, info, start, end, alternate in _matches(text):
+        if (run is not None and run[1].dimension == info.dimension and info.factor < run[1].factor
+                and not info.offset and not run[1].offset
+                and alternate == run[3] and not text[run[5]:start].strip()):
+            si_part = value * info.factor
+            run[0] += si_part / run[1].factor
+            run[2] += si_part
+            run[5] = end
+            continue
+        if run is not None:
+            quantities.append(_quantity(run))
+        run = [value, info, value * info.factor + info.offset, alternate, start, end]
+    if run is not None:
+        quantities.append(_quantity(run))
+    return quantities
+
+
+def _quantity(run: list) -> Quantity:
+    value, info, si_value, alternate, start, end = run
+    return Quantity(value, info.symbol, info.dimension, si_value, info.si_unit, alternate, start, end)
+
+
+def to_si_batch(values: Sequence[Any], units: Union[str, Sequence[Optional[str]], None]) -> Tuple[Any, List[Optional[str]]]:
+    """Convert a column of values to SI in one pass.
+
+    `units` is one unit for the whole column or one unit per value; `values`
+    may be a list or a NumPy array. Returns the SI values, as a float64 array
+    with NumPy and a list of floats otherwise, and their SI units. Values
+    that are not numbers (bool included) or have an unknown unit come back
+    as NaN with unit None, as do ints too large for a float:
+
+    >>> si_values, si_units = to_si_batch([10, 10**400, True, "x"], "ft")
+    >>> [round(float(value), 3) for value in si_values], si_units
+    ([3.048, nan, nan, nan], ['m', None, None, None])
+    """
+    np = optional_numpy()
+    if units is None or isinstance(units, str):
+        info = unit_info(units)
+        si_units = [info.si_unit if info is not None else None] * len(values)
+        if np is None:
+            si_values = _to_si_python(values, repeat(info))
+        elif info is None:
+            si_values = np.full(len(values), math.nan)
+        else:
+            si_values = _numeric_array(np, values) * info.factor + info.offset
+        return si_values, _known_units(np, si_values, si_units)
+
+    # One lexicon lookup per distinct unit
+    infos = {unit: unit_info(unit) for unit in set(units)}
+    si_units = list(map({unit: info.si_unit if info is not None else None
+                         for unit, info in infos.items()}.__getitem__, units))
+    if np is None:
+        si_values = _to_si_python(values, map(infos.__getitem__, units))
+    else:
+        names = list(infos)
+        factors = np.array([infos[name].factor if infos[name] is not None else math.nan for name in names])
+        offsets = np.array([infos[name].offset if infos[name] is not None else math.nan for name in names])
+        which = np.fromiter(map({name: i for i, name in enumerate(names)}.__getitem__, units),
+                            dtype=np.intp, count=len(units))
+        si_values = _numeric_array(np, values) * factors[which] + offsets[which]
+    return si_values, _known_units(np, si_values, si_units)
+
+
+def _known_units(np, si_values, si_units: List[Optional[str]]) -> List[Optional[str]]:
+    # No SI unit for values that did not convert
+    if np is None:
+        missing = [i for i, value in enumerate(si_values) if value != value]
+    else:
+        missing = np.flatnonzero(np.isnan(si_values)).tolist()
+    for i in missing:
+        si_units[i] = None
+    return si_units
+
+
+def _as_float(value: Any) -> float:
+    # NaN for non-numbers (bool included) and for ints too large for a float (10**400)
+    if type(value) not in (int, float):
+        return math.nan
+    try:
+        return float(value)
+    except OverflowError:
+        return math.nan
+
+
+def _numeric_array(np, values):
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return values.astype(float, copy=False)
+    if set(map(type, values)) <= {int, float}:
+        try:
+            return np.array(values, dtype=float)
+        except OverflowError:
+            pass
+    return np.fromiter(map(_as_float, values), dtype=float, count=len(values))
+
+
+def _to_si_python(values, infos):
+    result = []
+    for value, info in zip(values, infos):
+        value = _as_float(value)
+        result.append(math.nan if info is None else value * info.factor + info.offset)
+    return result
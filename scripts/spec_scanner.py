@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Spec Scanner
+
+Finds specification entries in catalog page text in a single pass:
+  name_value  "Max Platform Height: 30 ft"
+  bullet      "• Max Platform Height: 30 ft" (also "* ...")
+  table_row   "| Max Platform Height | 30 ft |"
+
+All three forms are alternatives of one precompiled pattern, so each page
+is scanned once. Matches are yielded as typed records with their offsets;
+an entry is reported once, in the most specific form that matched.
+"""
+
+import re
+from typing import Iterator, NamedTuple, Optional
+
+from quantity import parse_quantities, unit_info
+
+# Sub-patterns shared by every form
+_NAME = r'[A-Z][\w\s-]+(?:\([^)]+\))?'
+_VALUE = r'[\w\d\.\s-]+'
+
+SPEC_PATTERN = re.compile(
+    # Table-like format
+    rf'\|\s*(?P<table_name>{_NAME})\s*\|\s*(?P<table_value>{_VALUE})(?:\((?P<table_unit>[^)]+)\))?\s*\|'
+    # "Name: Value" pattern, optionally as a bullet point with * or •
+    rf'|(?P<bullet>[*•]\s*)?\b(?P<name>{_NAME})\s*:\s*(?P<value>{_VALUE})(?:\((?P<unit>[^)]+)\))?'
+)
+
+
+
+class SpecMatch(NamedTuple):
+    """A specification entry found in page text."""
+    kind: str            # "name_value", "bullet" or "table_row"
+    name: str
+    value: str
+    unit: Optional[str]  # unit given in parentheses after the value, if any
+    start: int
+    end: int
+
+
+def scan_specs(text: str) -> Iterator[SpecMatch]:
+    """Yield every specification entry in `text`, in order, from one pass over it."""
+    for match in SPEC_PATTERN.finditer(text):
+        if match.group("table_name") is not None:
+            kind = "table_row"
+            name, value, unit = match.group("table_name", "table_value", "table_unit")
+        else:
+            kind = "bullet" if match.group("bullet") else "name_value"
+            name, value, unit = match.group("name", "value", "unit")
+        yield SpecMatch(kind, name.strip(), value.strip(), unit.strip() if unit is not None else None,
+                        match.start(), match.end())
+
+
+def value_unit(value: str) -> Optional[str]:
+    """The unit of the first quantity in a value, e.g. '67,500 lb (30,600 kg)' -> 'lb', if any."""
+    quantities = parse_quantities(value)
+    return quantities[0].unit if quantities else None
+
+
+def spec_unit(spec: SpecMatch) -> Optional[str]:
+    """The unit of a spec entry: a unit given in parentheses, else that of its first quantity.
+
+    '500 (kg)' -> 'kg', '67,500 lb (30,600 kg)' -> 'lb', '67,500 (30,600 kg)' -> 'kg'.
+    """
+    if spec.unit is not None:
+        info = unit_info(spec.unit)
+        if info is not None:
+            return info.symbol
+    return value_unit(spec.value) or (value_unit(spec.unit) if spec.unit is not None else None)
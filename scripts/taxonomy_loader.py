@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+Taxonomy Loader
+
+Single-pass loader for the per-attribute definition files stored as
+attributes/<category>/<subcategory>/<code>.json. Validation and
+consolidation both use it, so they always see exactly the same file set.
+
+Files are read by a bounded thread pool, so per-file latency on network
+filesystems and cold CI checkouts overlaps instead of adding up.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Attribute categories, in the order their directories are walked
+ATTRIBUTE_CATEGORIES = ("physics", "brand")
+
+# Fields copied into the consolidated library, in output order
+CONSOLIDATED_FIELDS = ("name", "type", "category", "unit", "description")
+
+# Bookkeeping fields that only live in the per-attribute files
+METADATA_FIELDS = ("code", "subcategory", "added_date", "last_modified")
+
+# Threads used for bulk reads; the work is I/O bound, so more than the CPU count
+DEFAULT_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Files read per pool task; batching keeps pool overhead low when reads are fast
+READ_CHUNK = 64
+
+# Chunks kept in flight per thread, bounding memory for very large trees
+READ_AHEAD = 2
+
+
+class AttributeFile(NamedTuple):
+    """A per-attribute definition file found by the scan."""
+    path: Path
+    category: str
+    subcategory: str
+    stat: os.stat_result
+
+
+class AttributeRecord(NamedTuple):
+    """A parsed per-attribute definition file."""
+    path: Path
+    category: str
+    subcategory: str
+    stat: os.stat_result
+    data: Dict[str, Any]
+
+
+def _sorted_entries(path) -> List[os.DirEntry]:
+    with os.scandir(path) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
+
+
+def scan_attribute_files(attr_dir: Path) -> List[AttributeFile]:
+    """Walk attributes/<category>/<subcategory>/ once and return every JSON file with its stat info."""
+    files = []
+    for category in ATTRIBUTE_CATEGORIES:
+        category_dir = Path(attr_dir) / category
+        if not category_dir.is_dir():
+            continue
+        for subdir in _sorted_entries(category_dir):
+            if not subdir.is_dir():
+                continue
+            for entry in _sorted_entries(subdir.path):
+                if entry.name.endswith(".json") and entry.is_file():
+                    files.append(AttributeFile(Path(entry.path), category, subdir.name, entry.stat()))
+    return files
+
+
+def _map_ordered(fn: Callable[[Path], Any], paths: Iterable[Path],
+                 max_workers: Optional[int]) -> Iterator[Tuple[Path, Any]]:
+    workers = max_workers or DEFAULT_READ_WORKERS
+    if workers == 1:
+        for path in paths:
+            yield path, fn(path)
+        return
+
+    def run_chunk(chunk):
+        return [fn(path) for path in chunk]
+
+    pool = ThreadPoolExecutor(workers)
+    pending = deque()
+    chunk = []
+    try:
+        for path in paths:
+            chunk.append(path)
+            if len(chunk) < READ_CHUNK:
+                continue
+            pending.append((chunk, pool.submit(run_chunk, chunk)))
+            chunk = []
+            if len(pending) >= workers * READ_AHEAD:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+        if chunk:
+            pending.append((chunk, pool.submit(run_chunk, chunk)))
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def read_files(paths: Iterable[Path], max_workers: Optional[int] = None) -> Iterator[Tuple[Path, bytes]]:
+    """Read files concurrently and yield (path, contents) in the order given.
+
+    An error reading a file is raised when that file's turn comes.
+    """
+    return _map_ordered(Path.read_bytes, map(Path, paths), max_workers)
+
+
+def read_json_files(paths: Iterable[Path], max_workers: Optional[int] = None) -> Iterator[Tuple[Path, Any]]:
+    """Read and decode JSON files concurrently and yield (path, data) in the order given."""
+    return _map_ordered(_read_json, map(Path, paths), max_workers)
+
+
+def iter_attribute_records(attr_dir: Path, max_workers: Optional[int] = None) -> Iterator[AttributeRecord]:
+    """Scan the attributes tree and yield each per-attribute file as it is parsed."""
+    attr_files = scan_attribute_files(attr_dir)
+    loaded = read_json_files((attr_file.path for attr_file in attr_files), max_workers)
+    for attr_file, (_, data) in zip(attr_files, loaded):
+        yield AttributeRecord(*attr_file, data)
+
+
+def load_attribute_records(attr_dir: Path, max_workers: Optional[int] = None) -> List[AttributeRecord]:
+    """Scan the attributes tree and parse every per-attribute file."""
+    return list(iter_attribute_records(attr_dir, max_workers))
+
+
+def attribute_file_location(attr_dir: Path, path: Path) -> Optional[Tuple[str, str]]:
+    """Return (category, subcategory) if path is a per-attribute file, otherwise None."""
+    path = Path(path)
+    if path.parent.parent.parent != Path(attr_dir) or path.parent.parent.name not in ATTRIBUTE_CATEGORIES:
+        return None
+    return path.parent.parent.name, path.parent.name
+
+
+def to_consolidated(attr_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the core attribute data stored in the consolidated file."""
+    return {field: attr_data[field] for field in CONSOLIDATED_FIELDS if field in attr_data}
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+Taxonomy Store
+
+Read-only query API over a taxonomy checkout: attribute definitions,
+category trees and products. Attributes are looked up in the memory-mapped
+binary library (see binary_library.py) and decoded on demand, with an LRU
+cache of decoded entries, so the library is never held as Python objects.
+Category trees and products are only read when first asked for.
+
+    from taxonomy_store import TaxonomyStore
+
+    with TaxonomyStore() as store:
+        store.get_attribute("battery_voltage")
+        store.attributes_for_category("Aerial Work Platforms > Boom Lifts > Boom Lifts")
+        for product in store.iter_products(category="Electric Boom Lifts"):
+            ...
+
+A store is a snapshot: files changed after it has read them are not seen.
+Returned objects are shared with the cache and must not be modified.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from binary_library import BinaryLibrary, binary_path
+from category_index import CategoryIndex, CategoryPath, build_category_index
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Decoded attribute definitions kept by default
+DEFAULT_CACHE_SIZE = 4096
+
+
+class TaxonomyStore:
+    """Lazy queries over the attributes, categories and products under `root`."""
+
+    def __init__(self, root=ROOT, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.root = Path(root)
+        self.consolidated_file = self.root / "attributes" / "consolidated" / "consolidated_attributes.json"
+        self._library = None
+        self._category_trees = None
+        self._category_index = None
+        self._cached_attribute = lru_cache(maxsize=cache_size)(self._load_attribute)
+
+    def _attributes(self) -> Mapping[str, Dict[str, Any]]:
+        if self._library is None:
+            binary_file = binary_path(self.consolidated_file)
+            # validate.py checks that the binary copy matches the JSON library
+            if binary_file.exists():
+                self._library = BinaryLibrary(binary_file)
+            else:
+                # No binary copy (e.g. a hand-made tree): fall back to the JSON library
+                with open(self.consolidated_file, 'r') as f:
+                    self._library = json.load(f)["attributes"]
+        return self._library
+
+    def _load_attribute(self, code: str) -> Optional[Dict[str, Any]]:
+        return self._attributes().get(code)
+
+    def get_attribute(self, code: str) -> Optional[Dict[str, Any]]:
+        """The definition of attribute `code`, or None if it is not in the library."""
+        return self._cached_attribute(code)
+
+    def attribute_codes(self) -> Iterator[str]:
+        """Every attribute code in the library."""
+        return iter(self._attributes())
+
+    def category_trees(self) -> List[Dict[str, Any]]:
+        """The root node of every category tree, in file name order."""
+        if self._category_trees is None:
+            self._category_trees = []
+            for path in sorted((self.root / "categories").glob("*.json")):
+                with open(path, 'r') as f:
+                    self._category_trees.append(json.load(f))
+        return self._category_trees
+
+    def category_index(self) -> CategoryIndex:
+        """Path and name indexes over the category trees, built on first use."""
+        if self._category_index is None:
+            self._category_index = build_category_index(self.category_trees())
+        return self._category_index
+
+    def find_category(self, path: CategoryPath) -> Optional[Dict[str, Any]]:
+        """The index entry of the category at `path` (root name first), or None."""
+        return self.category_index().node(path)
+
+    def attributes_for_category(self, path: CategoryPath) -> List[Dict[str, Any]]:
+        """The attributes the category at `path` requires, with their definitions.
+
+        Requirements are materialized by the category index: a leaf's own
+        refs, or for an internal node the refs shared by all its children.
+        Each entry has "ref", "commonality_threshold" and "attribute" (the
+        definition, or None if the ref is not in the library). Raises
+        KeyError if there is no such category.
+        """
+        return [
+            {"ref": code, "commonality_threshold": threshold, "attribute": self.get_attribute(code)}
+            for code, threshold in self.category_index().requirements(path).items()
+        ]
+
+    def iter_products(self, category: Optional[str] = None, feed=None) -> Iterator[Dict[str, Any]]:
+        """Yield products one at a time, optionally only those in `category`.
+
+        Products come from examples/*.json, or from an NDJSON/JSONL `feed`
+        (one product per line) when one is given.
+        """
+        for product in self._read_products(feed):
+            if category is None or product.get("category") == category:
+                yield product
+
+    def _read_products(self, feed) -> Iterator[Dict[str, Any]]:
+        if feed is not None:
+            with open(feed, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+        for path in sorted((self.root / "examples").glob("*.json")):
+            with open(path, 'r') as f:
+                yield json.load(f)
+
+    def close(self) -> None:
+        if isinstance(self._library, BinaryLibrary):
+            self._library.close()
+        self._library = None
+        self._cached_attribute.cache_clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,11 +1,46 @@
 #!/usr/bin/env python3
 
+import argparse
+import hashlib
 import json
 import os
+import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
+from queue import Empty, Queue
 import jsonschema
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+
+# jsonschema >= 4.18 resolves $ref through a referencing.Registry; older
+# releases only ship the (deprecated) RefResolver
+try:
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT202012
+    _USE_REGISTRY = True
+except ImportError:  # old jsonschema
+    _USE_REGISTRY = False
+
+from binary_library import binary_path, encode_library
+from value_checks import check_values
+# Schema-specialized validators from build_validators.py, used as a fast path
+try:
+    import generated_validators
+except ImportError:
+    generated_validators = None
+
+from taxonomy_loader import (
+    CONSOLIDATED_FIELDS,
+    METADATA_FIELDS,
+    attribute_file_location,
+    read_files,
+    scan_attribute_files,
+    to_consolidated,
+)
 
 # Root directory of the repository
 ROOT_DIR = Path(__file__).parent.parent.absolute()
@@ -17,6 +52,66 @@ SCHEMA_DIR = ROOT_DIR / "schema"
 ATTRIBUTES_DIR = ROOT_DIR / "attributes"
 CATEGORIES_DIR = ROOT_DIR / "categories"
 EXAMPLES_DIR = ROOT_DIR / "examples"
+CONSOLIDATED_FILE = ATTRIBUTES_DIR / "consolidated" / "consolidated_attributes.json"
+
+# Manifest of the last passing --incremental run (content hashes and schema versions)
+MANIFEST_FILE = ROOT_DIR / ".validate_manifest.json"
+MANIFEST_VERSION = 2
+
+# Modules whose rules decide whether a file is valid; editing any of them revalidates everything
+SCRIPTS_DIR = Path(__file__).resolve().parent
+VALIDATOR_SOURCES = [
+    "validate.py", "value_checks.py", "taxonomy_loader.py", "generated_validators.py", "binary_library.py",
+]
+
+# Products per batch when streaming NDJSON/JSONL product corpora
+DEFAULT_BATCH_SIZE = 1000
+
+# Seconds between stat scans in --watch mode when watchdog is not installed
+WATCH_INTERVAL = 0.5
+
+# Schema and data directory for each kind of taxonomy file
+SCHEMA_FILES = {
+    "attributes": "attribute.schema.json",
+    "categories": "category.schema.json",
+    "examples": "product.schema.json",
+}
+KIND_DIRS = {
+    "attributes": ATTRIBUTES_DIR,
+    "categories": CATEGORIES_DIR,
+    "examples": EXAMPLES_DIR,
+}
+
+# Point every path at another taxonomy root (e.g. a generated benchmark tree)
+def set_root(root):
+    global ROOT_DIR, SCHEMA_DIR, ATTRIBUTES_DIR, CATEGORIES_DIR, EXAMPLES_DIR, CONSOLIDATED_FILE, MANIFEST_FILE
+    ROOT_DIR = Path(root).absolute()
+    SCHEMA_DIR = ROOT_DIR / "schema"
+    ATTRIBUTES_DIR = ROOT_DIR / "attributes"
+    CATEGORIES_DIR = ROOT_DIR / "categories"
+    EXAMPLES_DIR = ROOT_DIR / "examples"
+    CONSOLIDATED_FILE = ATTRIBUTES_DIR / "consolidated" / "consolidated_attributes.json"
+    MANIFEST_FILE = ROOT_DIR / ".validate_manifest.json"
+    KIND_DIRS.update(attributes=ATTRIBUTES_DIR, categories=CATEGORIES_DIR, examples=EXAMPLES_DIR)
+    reset_caches()
+
+# Compiled validators, keyed by schema file name and built once per process
+_VALIDATORS = {}
+
+# Generated is_valid functions, keyed by schema $id, for schemas they are current for
+_FAST_CHECKS = {}
+_REGISTRY = None
+
+# Attribute code -> definition, built once per process from the consolidated library
+_ATTRIBUTE_INDEX = None
+
+# Parse a JSON file, returning None if it is missing or malformed
+def load_json_quietly(file_path):
+    try:
+        with open(file_path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
 
 # Load schemas
 def load_schema(schema_file):
@@ -24,75 +119,766 @@ def load_schema(schema_file):
     with open(schema_path, 'r') as f:
         return json.load(f)
 
-# Validate JSON file against a schema
-def validate_json_file(file_path, schema):
-    with open(file_path, 'r') as f:
-        try:
-            data = json.load(f)
-            validate(instance=data, schema=schema)
-            # extra custom rule for attribute files
-            if schema.get("$id") == "attribute.schema.json":
-                if "unit" in data and data.get("category") != "physics":
-                    raise jsonschema.exceptions.ValidationError("Attributes with 'unit' must have category 'physics'")
-            return True
-        except json.JSONDecodeError as e:
-            print(f"Error parsing {file_path}: {e}")
-            return False
-        except jsonschema.exceptions.ValidationError as e:
-            print(f"Validation error in {file_path}: {e}")
-            return False
-
-# Validate attribute files
-def validate_attributes():
-    schema = load_schema("attribute.schema.json")
-    success = True
-    
-    for file_path in ATTRIBUTES_DIR.glob("*.json"):
-        with open(file_path) as f:
-            data = json.load(f)
-        # if consolidated
-        if isinstance(data, dict) and "attributes" in data:
-            for code, attr in data["attributes"].items():
-                try:
-                    validate(instance=attr, schema=schema)
-                    if "unit" in attr and attr.get("category") != "physics":
-                        raise jsonschema.exceptions.ValidationError("Attributes with 'unit' must have category 'physics'")
-                except jsonschema.exceptions.ValidationError as e:
-                    print(f"Validation error in consolidated attribute '{code}': {e}")
-                    success = False
+# Shared registry of every schema in SCHEMA_DIR, keyed by its $id, so $refs
+# (including the recursive one in category.schema.json) resolve from memory
+def load_registry():
+    global _REGISTRY
+    if _REGISTRY is None:
+        schemas = {}
+        for schema_path in sorted(SCHEMA_DIR.glob("*.schema.json")):
+            schema = load_schema(schema_path.name)
+            schemas[schema.get("$id", schema_path.name)] = schema
+        if _USE_REGISTRY:
+            _REGISTRY = Registry().with_resources(
+                (uri, Resource.from_contents(schema, default_specification=DRAFT202012))
+                for uri, schema in schemas.items()
+            )
         else:
-            success = validate_json_file(file_path, schema) and success
-     
-    return success
+            _REGISTRY = schemas
+    return _REGISTRY
+
+# Build (once) and return the validator for a schema file
+def get_validator(schema_file):
+    validator = _VALIDATORS.get(schema_file)
+    if validator is None:
+        schema = load_schema(schema_file)
+        cls = jsonschema.validators.validator_for(schema)
+        # check the schema itself only once, not for every document
+        cls.check_schema(schema)
+        if _USE_REGISTRY:
+            validator = cls(schema, registry=load_registry())
+        else:
+            resolver = jsonschema.RefResolver.from_schema(schema, store=load_registry())
+            validator = cls(schema, resolver=resolver)
+        _VALIDATORS[schema_file] = validator
+        fast_check = load_fast_check(schema_file)
+        if fast_check is not None:
+            _FAST_CHECKS[schema.get("$id", schema_file)] = fast_check
+    return validator
+
+# Generated is_valid function for a schema, unless missing or generated from a different schema
+def load_fast_check(schema_file):
+    if generated_validators is None or schema_file not in generated_validators.VALIDATORS:
+        return None
+    if generated_validators.SCHEMA_HASHES[schema_file] != file_digest(SCHEMA_DIR / schema_file):
+        return None
+    return generated_validators.VALIDATORS[schema_file][0]
+
+# Raise the same error jsonschema.validate() would report for an instance. Documents
+# the generated validator accepts skip jsonschema; anything else is re-checked by it
+# so error messages are unchanged.
+def check_instance(validator, instance):
+    fast_check = _FAST_CHECKS.get(validator.schema.get("$id"))
+    if fast_check is not None and fast_check(instance):
+        return
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+# Custom rule for attribute definitions on top of attribute.schema.json
+def check_attribute(attr):
+    if "unit" in attr and attr.get("category") != "physics":
+        raise jsonschema.exceptions.ValidationError("Attributes with 'unit' must have category 'physics'")
+
+# Validate a parsed document against a schema and return its error messages
+def validate_document(file_path, data, validator):
+    try:
+        check_instance(validator, data)
+        # extra custom rule for attribute files
+        if validator.schema.get("$id") == "attribute.schema.json":
+            check_attribute(data)
+        return []
+    except jsonschema.exceptions.ValidationError as e:
+        return [f"Validation error in {file_path}: {e}"]
 
-# Validate category files
-def validate_categories():
-    schema = load_schema("category.schema.json")
+# Build (once) the hash index of attribute codes to their definitions
+def load_attribute_index():
+    global _ATTRIBUTE_INDEX
+    if _ATTRIBUTE_INDEX is None:
+        data = load_json_quietly(CONSOLIDATED_FILE)
+        attributes = data.get("attributes") if isinstance(data, dict) else None
+        _ATTRIBUTE_INDEX = {
+            code: attr
+            for code, attr in (attributes or {}).items()
+            if isinstance(attr, dict)
+        }
+    return _ATTRIBUTE_INDEX
+
+# Check every attribute ref in a (schema-valid) category tree exists in the library
+def check_category_refs(location, data, index):
+    errors = []
+    stack = [(data["name"], data)]
+    while stack:
+        path, node = stack.pop()
+        for attr in node.get("attributes", []):
+            if attr["ref"] not in index:
+                errors.append(f"Integrity error in {location}: category '{path}' "
+                              f"references unknown attribute '{attr['ref']}'")
+        for child in reversed(node.get("subcategories", [])):
+            stack.append((f"{path} > {child['name']}", child))
+    return errors
+
+# Split a (schema-valid) product's attributes into errors for unknown codes and
+# (row id, code, value) rows for the bulk value checks
+def product_rows(location, data, index, row_key=()):
+    errors = []
+    rows = []
+    for i, entry in enumerate(data["attributes"]):
+        code = entry["attribute"]
+        if code not in index:
+            errors.append(((*row_key, i), f"Integrity error in {location}: attributes[{i}] "
+                                          f"references unknown attribute '{code}'"))
+        else:
+            rows.append(((*row_key, i), code, entry["value"]))
+    return errors, rows
+
+# Check every attribute of a (schema-valid) product exists and its value matches the attribute
+def check_product_attributes(location, data, index):
+    errors, rows = product_rows(location, data, index)
+    errors += [((i,), f"Integrity error in {location}: attributes[{i}] {message}")
+               for (i,), message in check_values(rows, index)]
+    return [message for _, message in sorted(errors, key=lambda error: error[0])]
+
+INTEGRITY_CHECKS = {
+    "categories": check_category_refs,
+    "examples": check_product_attributes,
+}
+
+# Validate a per-attribute file: its bookkeeping fields and location, plus the
+# core definition that consolidation copies into the library
+def validate_definition_file(file_path, data, location, validator):
+    if not isinstance(data, dict):
+        return [f"Validation error in {file_path}: {data!r} is not of type 'object'"]
+    category, subcategory = location
+    errors = []
+    for field in METADATA_FIELDS:
+        if field not in data:
+            errors.append(f"Validation error in {file_path}: '{field}' is a required property")
+    unexpected = [field for field in data if field not in CONSOLIDATED_FIELDS and field not in METADATA_FIELDS]
+    if unexpected:
+        errors.append(f"Validation error in {file_path}: Additional properties are not allowed "
+                      f"({', '.join(map(repr, unexpected))} unexpected)")
+    if "code" in data and data["code"] != file_path.stem:
+        errors.append(f"Validation error in {file_path}: code {data['code']!r} does not match the file name")
+    if "category" in data and data["category"] != category:
+        errors.append(f"Validation error in {file_path}: category {data['category']!r} "
+                      f"does not match directory '{category}'")
+    if "subcategory" in data and data["subcategory"] != subcategory:
+        errors.append(f"Validation error in {file_path}: subcategory {data['subcategory']!r} "
+                      f"does not match directory '{subcategory}'")
+    return errors + validate_document(file_path, to_consolidated(data), validator)
+
+# Validate an attribute file: a per-attribute definition, a consolidated library
+# or a legacy flat definition
+def validate_attribute_file(file_path, raw=None):
+    validator = get_validator(SCHEMA_FILES["attributes"])
+    try:
+        data = parse_file(file_path, raw)
+    except json.JSONDecodeError as e:
+        return [f"Error parsing {file_path}: {e}"]
+    location = attribute_file_location(ATTRIBUTES_DIR, file_path)
+    if location is not None:
+        return validate_definition_file(file_path, data, location, validator)
+    # if consolidated
+    if isinstance(data, dict) and "attributes" in data:
+        errors = []
+        for code, attr in data["attributes"].items():
+            try:
+                check_instance(validator, attr)
+                check_attribute(attr)
+            except jsonschema.exceptions.ValidationError as e:
+                errors.append(f"Validation error in consolidated attribute '{code}': {e}")
+        return errors + check_binary_library(file_path, data["attributes"])
+    return validate_document(file_path, data, validator)
+
+# The binary copy of a consolidated library, if there is one, must encode the same attributes
+def check_binary_library(file_path, attributes):
+    binary_file = binary_path(file_path)
+    if not binary_file.exists() or not isinstance(attributes, dict):
+        return []
+    if binary_file.read_bytes() != encode_library(attributes):
+        return [f"Integrity error in {binary_file}: does not match {file_path.name} "
+                f"(run python scripts/consolidate_attributes.py)"]
+    return []
+
+# Parse a file from its already-read contents, or from disk if none are given
+def parse_file(file_path, raw=None):
+    if raw is None:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    return json.loads(raw)
+
+# Validate one file of the given kind; this is the unit of work sent to the pool
+def validate_file(kind, file_path, raw=None):
+    if kind == "attributes":
+        return validate_attribute_file(file_path, raw)
+    try:
+        data = parse_file(file_path, raw)
+    except json.JSONDecodeError as e:
+        return [f"Error parsing {file_path}: {e}"]
+    errors = validate_document(file_path, data, get_validator(SCHEMA_FILES[kind]))
+    # cross-file checks only make sense once the document has the right shape
+    if not errors:
+        errors = INTEGRITY_CHECKS[kind](file_path, data, load_attribute_index())
+    return errors
+
+# Files to validate for each kind, sorted so output order never depends on the filesystem
+def collect_files(kind):
+    files = list(KIND_DIRS[kind].glob("*.json"))
+    if kind == "attributes":
+        # same file set consolidate_attributes.py reads, plus the library it writes
+        files += [attr_file.path for attr_file in scan_attribute_files(ATTRIBUTES_DIR)]
+        if CONSOLIDATED_FILE.exists():
+            files.append(CONSOLIDATED_FILE)
+    return sorted(files)
+
+# Warm the validator cache and attribute index once in each pool worker
+def init_worker(root=None):
+    if root is not None and Path(root) != ROOT_DIR:
+        set_root(root)
+    for schema_file in SCHEMA_FILES.values():
+        get_validator(schema_file)
+    load_attribute_index()
+
+# Drop the cached validators and/or attribute index so they are rebuilt on next use
+def reset_caches(schemas=True, index=True):
+    global _REGISTRY, _ATTRIBUTE_INDEX
+    if schemas:
+        _VALIDATORS.clear()
+        _FAST_CHECKS.clear()
+        _REGISTRY = None
+    if index:
+        _ATTRIBUTE_INDEX = None
+
+# Start validating every file of a kind; results come back in file order
+def start_kind(kind, executor=None, jobs=1, only=None):
+    files = collect_files(kind)
+    if only is not None:
+        files = [file_path for file_path in files if file_path in only]
+    if executor is None:
+        # in-process: overlap file reads on a thread pool, validate in file order
+        return files, (validate_file(kind, file_path, raw) for file_path, raw in read_files(files))
+    chunksize = max(1, len(files) // (jobs * 4))
+    return files, executor.map(validate_file, repeat(kind), files, chunksize=chunksize)
+
+# Print per-file errors in file order and report whether the kind passed
+def report_kind(files, results):
     success = True
-    
-    for file_path in CATEGORIES_DIR.glob("*.json"):
-        success = validate_json_file(file_path, schema) and success
-    
+    for file_path, errors in zip(files, results):
+        for error in errors:
+            print(error)
+            success = False
     return success
 
-# Validate product examples
-def validate_examples():
-    schema = load_schema("product.schema.json")
+# SHA-256 of a file's contents
+def file_digest(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def relative_path(file_path):
+    return Path(file_path).relative_to(ROOT_DIR).as_posix()
+
+# Hash every tracked file, reusing previous digests when size and mtime are unchanged
+def snapshot_files(previous=None):
+    previous = previous or {}
+    tracked = [file_path for kind in SCHEMA_FILES for file_path in collect_files(kind)]
+    if binary_path(CONSOLIDATED_FILE).exists():
+        tracked.append(binary_path(CONSOLIDATED_FILE))
+    files = {}
+    for file_path in tracked:
+        rel = relative_path(file_path)
+        stat = file_path.stat()
+        entry = previous.get(rel)
+        if not entry or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            entry = {"sha256": file_digest(file_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        files[rel] = entry
+    return files
+
+# Hash of the validator sources (missing ones, such as generated_validators.py, are skipped)
+def validator_version():
+    digest = hashlib.sha256()
+    for name in VALIDATOR_SOURCES:
+        source = SCRIPTS_DIR / name
+        if source.exists():
+            digest.update(f"{name}:{file_digest(source)}\n".encode())
+    return digest.hexdigest()
+
+# Schema version for each kind is the hash of its schema file and of the validator sources
+def schema_versions():
+    validator = validator_version()
+    return {
+        kind: hashlib.sha256(f"{file_digest(SCHEMA_DIR / schema_file)}:{validator}".encode()).hexdigest()
+        for kind, schema_file in SCHEMA_FILES.items()
+    }
+
+# Per-code hashes of a consolidated attribute library
+def entry_digests(data):
+    attributes = data.get("attributes") if isinstance(data, dict) else None
+    if not isinstance(attributes, dict):
+        return {}
+    return {
+        code: hashlib.sha256(json.dumps(attr, sort_keys=True).encode()).hexdigest()
+        for code, attr in attributes.items()
+    }
+
+# Attribute codes a category tree or product example depends on
+def referenced_codes(kind, data):
+    codes = set()
+    if kind == "categories":
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            for attr in node.get("attributes") or []:
+                if isinstance(attr, dict) and isinstance(attr.get("ref"), str):
+                    codes.add(attr["ref"])
+            stack.extend(node.get("subcategories") or [])
+    elif kind == "examples" and isinstance(data, dict):
+        for attr in data.get("attributes") or []:
+            if isinstance(attr, dict) and isinstance(attr.get("attribute"), str):
+                codes.add(attr["attribute"])
+    return codes
+
+# Codes defined by an attribute file that changed (or was deleted)
+def defined_codes(rel):
+    data = load_json_quietly(ROOT_DIR / rel)
+    if isinstance(data, dict) and "attributes" in data:
+        return set(entry_digests(data))
+    if isinstance(data, dict) and isinstance(data.get("code"), str):
+        return {data["code"]}
+    return {Path(rel).stem}
+
+# Files that differ from a git ref, relative to ROOT_DIR (committed, staged, unstaged and untracked)
+def git_changed_files(ref):
+    toplevel = Path(subprocess.check_output(
+        ["git", "rev-parse", "--show-toplevel"], cwd=ROOT_DIR, text=True).strip())
+    names = subprocess.check_output(
+        ["git", "diff", "--name-only", "--no-renames", ref, "--"], cwd=ROOT_DIR, text=True).splitlines()
+    names += subprocess.check_output(
+        ["git", "ls-files", "--others", "--exclude-standard"], cwd=toplevel, text=True).splitlines()
+    changed = set()
+    for name in names:
+        path = (toplevel / name).resolve()
+        if ROOT_DIR in path.parents:
+            changed.add(relative_path(path))
+    return changed
+
+# Whether any validator source differs from a git ref
+def git_validator_changed(ref):
+    names = subprocess.check_output(
+        ["git", "diff", "--name-only", ref, "--", *VALIDATOR_SOURCES], cwd=SCRIPTS_DIR, text=True)
+    return bool(names.strip())
+
+# Consolidated attribute entries as they were at a git ref
+def git_entry_digests(ref):
+    try:
+        content = subprocess.check_output(
+            ["git", "show", f"{ref}:./{relative_path(CONSOLIDATED_FILE)}"],
+            cwd=ROOT_DIR, stderr=subprocess.DEVNULL)
+        return entry_digests(json.loads(content))
+    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        return {}
+
+# Work out which files need validating, either against the last passing
+# manifest or against a git ref. Returns ({kind: paths or None for all}, new manifest).
+def plan_incremental(since=None):
+    manifest = load_json_quietly(MANIFEST_FILE)
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        manifest = None
+
+    files = snapshot_files(manifest["files"] if manifest else None)
+    versions = schema_versions()
+    current_entries = entry_digests(load_json_quietly(CONSOLIDATED_FILE))
+    # Reference lists cached by the last manifest run; a git ref is a different baseline
+    previous_refs = manifest["refs"] if manifest and since is None else {}
+
+    if since is not None:
+        changed = git_changed_files(since)
+        previous_entries = git_entry_digests(since)
+        if git_validator_changed(since):
+            stale_kinds = set(SCHEMA_FILES)
+        else:
+            stale_kinds = {kind for kind, schema_file in SCHEMA_FILES.items()
+                           if relative_path(SCHEMA_DIR / schema_file) in changed}
+    elif manifest is not None:
+        previous_files = manifest["files"]
+        changed = {rel for rel in files.keys() | previous_files.keys()
+                   if files.get(rel, {}).get("sha256") != previous_files.get(rel, {}).get("sha256")}
+        previous_entries = manifest["entries"]
+        stale_kinds = {kind for kind in SCHEMA_FILES if manifest["schemas"].get(kind) != versions[kind]}
+    else:
+        # No baseline yet: validate everything and record one
+        changed = set(files)
+        previous_entries = {}
+        stale_kinds = set(SCHEMA_FILES)
+
+    # A changed binary copy is checked together with the library it encodes
+    if relative_path(binary_path(CONSOLIDATED_FILE)) in changed:
+        changed.add(relative_path(CONSOLIDATED_FILE))
+
+    # Attribute codes whose definitions changed since the baseline
+    attr_prefix = relative_path(ATTRIBUTES_DIR) + "/"
+    changed_codes = {code for code in current_entries.keys() | previous_entries.keys()
+                     if current_entries.get(code) != previous_entries.get(code)}
+    for rel in changed:
+        if rel.startswith(attr_prefix) and rel.endswith(".json") and ROOT_DIR / rel != CONSOLIDATED_FILE:
+            changed_codes |= defined_codes(rel)
+
+    selected = {}
+    refs = {}
+    for kind in SCHEMA_FILES:
+        chosen = set()
+        for file_path in collect_files(kind):
+            rel = relative_path(file_path)
+            if kind != "attributes":
+                if rel in changed or rel not in previous_refs:
+                    refs[rel] = sorted(referenced_codes(kind, load_json_quietly(file_path)))
+                else:
+                    refs[rel] = previous_refs[rel]
+                if changed_codes.intersection(refs[rel]):
+                    chosen.add(file_path)
+            if rel in changed:
+                chosen.add(file_path)
+        selected[kind] = None if kind in stale_kinds else chosen
+
+    new_manifest = {
+        "version": MANIFEST_VERSION,
+        "schemas": versions,
+        "files": files,
+        "entries": current_entries,
+        "refs": refs,
+    }
+    return selected, new_manifest
+
+def write_manifest(manifest):
+    tmp_path = MANIFEST_FILE.with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_FILE)
+
+# Stream an NDJSON/JSONL corpus as batches of (line number, raw line), skipping blank lines
+def iter_line_batches(file_path, batch_size=DEFAULT_BATCH_SIZE):
+    batch = []
+    with open(file_path, 'rb') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            batch.append((lineno, line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+# Validate one batch of product lines; returns (products checked, error messages).
+# Values are checked for the whole batch at once, column by column.
+def validate_product_batch(file_path, batch):
+    validator = get_validator(SCHEMA_FILES["examples"])
+    index = load_attribute_index()
+    errors = []
+    rows = []
+    for lineno, line in batch:
+        location = f"{file_path}:{lineno}"
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            errors.append(((lineno, -1), f"Error parsing {location}: {e}"))
+            continue
+        line_errors = validate_document(location, data, validator)
+        if line_errors:
+            errors += [((lineno, -1), error) for error in line_errors]
+            continue
+        unknown, line_rows = product_rows(location, data, index, (lineno,))
+        errors += unknown
+        rows += line_rows
+    for (lineno, i), message in check_values(rows, index):
+        errors.append(((lineno, i), f"Integrity error in {file_path}:{lineno}: attributes[{i}] {message}"))
+    errors.sort(key=lambda error: error[0])
+    return len(batch), [message for _, message in errors]
+
+# Like executor.map, but keeps at most `window` tasks in flight so a lazy
+# input is never read far ahead of the results being consumed
+def bounded_map(executor, fn, items, window):
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+# Validate a product corpus line by line in constant memory
+def validate_product_feed(file_path, executor=None, jobs=1, batch_size=DEFAULT_BATCH_SIZE):
+    batches = iter_line_batches(file_path, batch_size)
+    validate_batch = partial(validate_product_batch, str(file_path))
+    if executor is None:
+        results = map(validate_batch, batches)
+    else:
+        results = bounded_map(executor, validate_batch, batches, jobs * 2)
     success = True
-    
-    for file_path in EXAMPLES_DIR.glob("*.json"):
-        success = validate_json_file(file_path, schema) and success
-    
+    checked = 0
+    for count, errors in results:
+        checked += count
+        for error in errors:
+            print(error)
+            success = False
+    print(f"Checked {checked} products in {file_path}")
     return success
 
+# Validate NDJSON/JSONL product corpora instead of the taxonomy tree
+def validate_product_feeds(feeds, jobs=1, batch_size=DEFAULT_BATCH_SIZE):
+    print("Validating product corpora...")
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(ROOT_DIR,))
+    try:
+        results = {feed: validate_product_feed(feed, executor, jobs, batch_size) for feed in feeds}
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print(f"\nValidation results:")
+    for feed, valid in results.items():
+        print(f"{feed}: {'✓' if valid else '✗'}")
+
+    if all(results.values()):
+        print("\nAll products are valid!")
+        return 0
+    else:
+        print("\nValidation failed. Please fix the errors above.")
+        return 1
+
+# Which kind of taxonomy file a path is ("schema" for schema files), or None if untracked
+def kind_of(file_path):
+    path = Path(file_path)
+    if path == binary_path(CONSOLIDATED_FILE):
+        return "attributes"
+    if path.suffix != ".json":
+        return None
+    if path.parent == SCHEMA_DIR:
+        return "schema"
+    if (path == CONSOLIDATED_FILE or path.parent == ATTRIBUTES_DIR
+            or attribute_file_location(ATTRIBUTES_DIR, path) is not None):
+        return "attributes"
+    for kind in ("categories", "examples"):
+        if path.parent == KIND_DIRS[kind]:
+            return kind
+    return None
+
+# (mtime, size) of every tracked file and schema
+def stat_snapshot():
+    paths = [file_path for kind in SCHEMA_FILES for file_path in collect_files(kind)]
+    paths += SCHEMA_DIR.glob("*.json")
+    paths.append(binary_path(CONSOLIDATED_FILE))
+    snapshot = {}
+    for file_path in paths:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+# Yield sets of changed paths by comparing stat snapshots
+def poll_changes(interval=WATCH_INTERVAL):
+    previous = stat_snapshot()
+    while True:
+        time.sleep(interval)
+        current = stat_snapshot()
+        changed = {path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path)}
+        previous = current
+        if changed:
+            yield changed
+
+# Yield sets of changed paths, from native filesystem events (inotify, FSEvents, ...)
+# when watchdog is installed, otherwise by polling
+def watch_changes(interval=WATCH_INTERVAL):
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        print(f"watchdog is not installed; polling for changes every {interval}s")
+        yield from poll_changes(interval)
+        return
+
+    events = Queue()
+
+    # only react to writes; newer watchdog also reports opens, which our own reads would trigger
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ("created", "modified", "moved", "deleted"):
+                return
+            events.put(Path(event.src_path))
+            if getattr(event, "dest_path", None):
+                events.put(Path(event.dest_path))
+
+    observer = Observer()
+    for directory, recursive in ((ATTRIBUTES_DIR, True), (CATEGORIES_DIR, False),
+                                 (EXAMPLES_DIR, False), (SCHEMA_DIR, False)):
+        if directory.is_dir():
+            observer.schedule(Handler(), str(directory), recursive=recursive)
+    observer.start()
+    try:
+        while True:
+            changed = {events.get()}
+            # editors often write a file in several steps; collect the burst
+            time.sleep(0.02)
+            while True:
+                try:
+                    changed.add(events.get_nowait())
+                except Empty:
+                    break
+            yield changed
+    finally:
+        observer.stop()
+        observer.join()
+
+class ValidationWatcher:
+    """Keeps validators, the attribute index and the dependency graph warm
+    and re-validates only the files a change touches."""
+
+    def __init__(self):
+        init_worker()
+        self.entries = entry_digests(load_json_quietly(CONSOLIDATED_FILE))
+        self.codes = {}    # per-attribute file -> codes it defines
+        self.refs = {}     # category/example file -> codes it references
+        self.errors = {}   # file -> errors from its last validation
+        for kind in SCHEMA_FILES:
+            for file_path in collect_files(kind):
+                self.track(kind, file_path)
+
+    def track(self, kind, file_path):
+        if kind == "attributes" and file_path != CONSOLIDATED_FILE:
+            self.codes[file_path] = defined_codes(relative_path(file_path))
+        elif kind in ("categories", "examples"):
+            self.refs[file_path] = referenced_codes(kind, load_json_quietly(file_path))
+
+    def validate(self, files):
+        start = time.perf_counter()
+        for file_path in sorted(files):
+            self.errors[file_path] = validate_file(kind_of(file_path), file_path)
+            for error in self.errors[file_path]:
+                print(error)
+        elapsed = (time.perf_counter() - start) * 1000
+        failing = [errors for errors in self.errors.values() if errors]
+        status = ("all files valid" if not failing else
+                  f"{sum(map(len, failing))} error(s) in {len(failing)} file(s)")
+        print(f"[{time.strftime('%H:%M:%S')}] validated {len(files)} file(s) in {elapsed:.1f} ms: {status}")
+
+    def validate_all(self):
+        self.validate([file_path for kind in SCHEMA_FILES for file_path in collect_files(kind)])
+
+    def handle(self, changed):
+        # A changed binary copy is checked together with the library it encodes
+        binary_file = binary_path(CONSOLIDATED_FILE)
+        kinds = {CONSOLIDATED_FILE if Path(path) == binary_file else Path(path): kind_of(path) for path in changed}
+        kinds = {path: kind for path, kind in kinds.items() if kind is not None}
+        if not kinds:
+            return
+        if "schema" in kinds.values():
+            reset_caches(index=False)
+            self.validate_all()
+            return
+
+        to_check = set()
+        changed_codes = set()
+        for file_path, kind in kinds.items():
+            exists = file_path.exists()
+            if file_path == CONSOLIDATED_FILE:
+                entries = entry_digests(load_json_quietly(file_path))
+                changed_codes |= {code for code in entries.keys() | self.entries.keys()
+                                  if entries.get(code) != self.entries.get(code)}
+                self.entries = entries
+                reset_caches(schemas=False)
+            elif kind == "attributes":
+                changed_codes |= self.codes.pop(file_path, set())
+                changed_codes |= defined_codes(relative_path(file_path))
+            else:
+                self.refs.pop(file_path, None)
+            if exists:
+                self.track(kind, file_path)
+                to_check.add(file_path)
+            else:
+                self.errors.pop(file_path, None)
+
+        # categories and examples that reference a changed attribute
+        to_check.update(file_path for file_path, codes in self.refs.items() if codes & changed_codes)
+        self.validate(to_check)
+
+# Validate everything once, then re-validate on every change until interrupted
+def watch(interval=WATCH_INTERVAL):
+    print("Watching taxonomy data for changes (Ctrl+C to stop)...")
+    watcher = ValidationWatcher()
+    watcher.validate_all()
+    try:
+        for changed in watch_changes(interval):
+            watcher.handle(changed)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Validate taxonomy data against the JSON schemas.")
+    parser.add_argument("--root", type=Path,
+                        help="taxonomy root to validate (default: this repository)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of worker processes (0 = one per CPU, default: 1)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--incremental", action="store_true",
+                      help=f"only re-validate files changed since the last passing run "
+                           f"(recorded in {MANIFEST_FILE.name}) and the files that depend on them")
+    mode.add_argument("--since", metavar="GIT_REF",
+                      help="only re-validate files changed since GIT_REF and the files that depend on them")
+    parser.add_argument("--products", nargs="+", metavar="FEED", type=Path,
+                        help="validate NDJSON/JSONL product corpora (one product per line) "
+                             "instead of the taxonomy tree")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-validate files (and their dependents) as they change")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"products per batch when validating corpora (default: {DEFAULT_BATCH_SIZE})")
+    return parser.parse_args(argv)
+
 # Main function
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+    if args.root is not None:
+        set_root(args.root)
+    jobs = args.jobs or os.cpu_count() or 1
+    if args.products:
+        return validate_product_feeds(args.products, jobs, args.batch_size)
+    if args.watch:
+        return watch()
     print("Validating taxonomy data...")
-    
-    # Validate all files
-    attr_valid = validate_attributes()
-    cat_valid = validate_categories()
-    ex_valid = validate_examples()
+
+    selected = dict.fromkeys(SCHEMA_FILES)
+    manifest = None
+    if args.incremental or args.since:
+        try:
+            selected, manifest = plan_incremental(args.since)
+        except subprocess.CalledProcessError as e:
+            print(f"Could not diff against {args.since} ({e}); validating everything.")
+        else:
+            for kind, only in selected.items():
+                total = len(collect_files(kind))
+                count = total if only is None else len(only)
+                print(f"  {kind}: {count} of {total} files need validation")
+
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(ROOT_DIR,))
+    try:
+        # Submit all kinds up front so workers stay busy, then report in a fixed order
+        pending = {kind: start_kind(kind, executor, jobs, selected[kind]) for kind in SCHEMA_FILES}
+        attr_valid = report_kind(*pending["attributes"])
+        cat_valid = report_kind(*pending["categories"])
+        ex_valid = report_kind(*pending["examples"])
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # Print results
     print(f"\nValidation results:")
@@ -102,6 +888,8 @@ def main():
     
     # Exit with appropriate code
     if attr_valid and cat_valid and ex_valid:
+        if args.incremental and manifest is not None:
+            write_manifest(manifest)
         print("\nAll files are valid!")
         return 0
     else:
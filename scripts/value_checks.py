@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Product Value Checks
+
+Bulk checks of product attribute values against the attribute library:
+every value must match its attribute's declared type, and physics values
+must be finite and inside a plausible range for their unit.
+
+Rows are grouped by attribute code and each column is checked as a whole.
+The types of a column are checked once per distinct type; physics columns
+are range-checked as a float64 array with NumPy when it is installed
+(imported on first use) and in plain Python otherwise.
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Python types accepted for each attribute type. bool is a subclass of int,
+# so types are compared exactly rather than with isinstance.
+VALUE_TYPES = {
+    "string": (str,),
+    "number": (int, float),
+    "boolean": (bool,),
+}
+
+# Plausible (min, max) for physics values by unit, lower-cased. Generous on
+# purpose: they catch unit mix-ups and typos, not unusual machines.
+PLAUSIBLE_RANGES = {
+    # length
+    "mm": (0, 1_000_000), "cm": (0, 100_000), "m": (0, 1_000), "in": (0, 40_000), "ft": (0, 3_300),
+    # mass
+    "g": (0, 1e9), "kg": (0, 1_000_000), "lb": (0, 2_200_000), "ton": (0, 1_100), "tonne": (0, 1_000),
+    # force
+    "n": (0, 1e7), "kn": (0, 10_000), "lbf": (0, 2_250_000),
+    # power
+    "w": (0, 1e7), "kw": (0, 10_000), "hp": (0, 13_500),
+    # voltage
+    "v": (0, 50_000), "kv": (0, 50),
+    # current
+    "a": (0, 10_000), "ma": (0, 1e7),
+    # pressure
+    "psi": (0, 15_000), "bar": (0, 1_000), "kpa": (0, 100_000), "mpa": (0, 100),
+    # capacity
+    "l": (0, 100_000), "gallon": (0, 26_000), "gal": (0, 26_000), "yd³": (0, 100), "m³": (0, 80),
+}
+
+
+def group_by_attribute(rows: Iterable[Tuple[Any, str, Any]]) -> Dict[str, Tuple[List[Any], List[Any]]]:
+    """Group (row_id, code, value) rows into per-code columns of row ids and values."""
+    columns = {}
+    for row_id, code, value in rows:
+        column = columns.get(code)
+        if column is None:
+            column = columns[code] = ([], [])
+        column[0].append(row_id)
+        column[1].append(value)
+    return columns
+
+
+def _is_finite(value: Any) -> bool:
+    # Ints too large for a float (10**400) count as not finite rather than raising OverflowError
+    try:
+        return math.isfinite(value)
+    except OverflowError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def optional_numpy():
+    """NumPy, imported on first use (it is slow to import); None if not installed.
+
+    Shared by the bulk checks here and quantity.to_si_batch, whose
+    pure-Python paths give the same results.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _check_range_numpy(np, values: List[Any], bounds) -> List[int]:
+    # Only called on columns of ints and floats
+    try:
+        numeric = np.fromiter(values, dtype=float, count=len(values))
+    except OverflowError:
+        return _check_column_python(values, (int, float), bounds)[1]
+    low, high = bounds
+    with np.errstate(invalid="ignore"):
+        in_range = np.isfinite(numeric) & (numeric >= low) & (numeric <= high)
+    return np.flatnonzero(~in_range).tolist()
+
+
+def _check_column_python(values: List[Any], accepted: Tuple[type, ...], bounds) -> Tuple[List[int], List[int]]:
+    wrong_type = []
+    out_of_range = []
+    low, high = bounds if bounds is not None else (None, None)
+    for i, value in enumerate(values):
+        if type(value) not in accepted:
+            wrong_type.append(i)
+        elif bounds is not None and not (_is_finite(value) and low <= value <= high):
+            out_of_range.append(i)
+    return wrong_type, out_of_range
+
+
+def check_column(values: List[Any], attr: Dict[str, Any]) -> Tuple[List[int], List[int]]:
+    """Check one attribute's column of values.
+
+    Returns the positions of values with the wrong type and of physics
+    values outside the plausible range for the attribute's unit.
+    """
+    accepted = VALUE_TYPES.get(attr.get("type"))
+    if accepted is None:
+        return [], []
+    bounds = None
+    if attr.get("type") == "number" and attr.get("category") == "physics":
+        bounds = PLAUSIBLE_RANGES.get(str(attr.get("unit", "")).lower(), (-math.inf, math.inf))
+    if not set(map(type, values)) <= set(accepted):
+        # Some values have the wrong type: check the column value by value
+        return _check_column_python(values, accepted, bounds)
+    if bounds is None:
+        return [], []
+    np = optional_numpy()
+    if np is None:
+        return _check_column_python(values, accepted, bounds)
+    return [], _check_range_numpy(np, values, bounds)
+
+
+def check_values(rows: Iterable[Tuple[Any, str, Any]], attributes: Dict[str, Dict[str, Any]]) -> List[Tuple[Any, str]]:
+    """Check (row_id, code, value) rows against the attribute library.
+
+    Rows whose code is not in `attributes` are skipped; reporting unknown
+    codes is up to the caller. Returns (row_id, message) pairs sorted by row id.
+    """
+    issues = []
+    for code, (row_ids, values) in group_by_attribute(rows).items():
+        attr = attributes.get(code)
+        if attr is None:
+            continue
+        wrong_type, out_of_range = check_column(values, attr)
+        for i in wrong_type:
+            issues.append((row_ids[i], f"value {values[i]!r} for '{code}' is not of type '{attr['type']}'"))
+        for i in out_of_range:
+            value = values[i]
+            if not _is_finite(value):
+                issues.append((row_ids[i], f"value {value!r} for '{code}' is not a finite number"))
+                continue
+            low, high = PLAUSIBLE_RANGES[str(attr.get("unit", "")).lower()]
+            issues.append((row_ids[i], f"value {value!r} for '{code}' is outside the plausible "
+                                       f"range {low:g}-{high:g} {attr['unit']}"))
+    issues.sort(key=lambda issue: issue[0])
+    return issues